@@ -3,6 +3,7 @@ import { useState, useRef, useEffect } from 'react';
 import { useNavigate } from 'react-router-dom';
 import { Camera, Mic, MicOff, Video, VideoOff, MessageSquare, Square, Circle, Loader2 } from 'lucide-react';
 import logo from './assets/logo.png';
+import { readServerSentEvents } from './sse';
 
 export default function InterviewPage() {
   const navigate = useNavigate();
@@ -17,6 +18,8 @@ export default function InterviewPage() {
   const videoRef = useRef(null);
   const mediaRecorderRef = useRef(null);
   const recordedChunksRef = useRef([]);
+  // Set to false once the backend reports that direct S3 uploads are not configured
+  const directUploadRef = useRef(true);
   const [stream, setStream] = useState(null);
   const [questions, setQuestions] = useState([]);
   const [loading, setLoading] = useState(true);
@@ -106,7 +109,7 @@ export default function InterviewPage() {
         console.log('Generating questions for:', data.companyName);
         setLoading(true);
         
-        const response = await fetch('http://localhost:5000/api/start-interview', {
+        const response = await fetch('http://localhost:5000/api/start-interview-stream', {
           method: 'POST',
           headers: {
             'Content-Type': 'application/json',
@@ -117,17 +120,29 @@ export default function InterviewPage() {
           })
         });
 
-        if (response.ok) {
-          const result = await response.json();
-          console.log('Questions API response:', result);
-          
-          if (result.success && result.questions && result.questions.length > 0) {
-            const questionsList = result.questions.map(q => q.text);
-            console.log('Generated questions:', questionsList);
-            setQuestions(questionsList);
-            setSubtitle(questionsList[0] || '');
-            localStorage.setItem('generatedQuestions', JSON.stringify(result.questions));
-          } else {
+        if (response.ok && response.body) {
+          // Questions arrive as Server-Sent Events; show each one as soon as it lands
+          const received = [];
+          let failed = false;
+
+          await readServerSentEvents(response, (eventType, data) => {
+            if (eventType === 'error') {
+              console.error('Question stream error:', data);
+              failed = true;
+            } else if (eventType === 'message') {
+              received.push(data);
+              setQuestions(received.map(q => q.text));
+              if (received.length === 1) {
+                setSubtitle(data.text);
+                setLoading(false);
+              }
+            }
+          });
+
+          if (received.length > 0 && !failed) {
+            console.log('Generated questions:', received.map(q => q.text));
+            localStorage.setItem('generatedQuestions', JSON.stringify(received));
+          } else if (received.length === 0) {
             console.warn('No questions in response, using defaults');
             setQuestions([
               "Tell me about yourself and your background.",
@@ -222,11 +237,60 @@ export default function InterviewPage() {
     }
   };
 
+  // Upload straight to object storage with a presigned URL, bypassing the backend.
+  // Returns false if direct uploads are unavailable so the caller can fall back.
+  const uploadRecordingDirect = async (blob) => {
+    try {
+      const urlResponse = await fetch('http://localhost:5000/api/recording-upload-url', {
+        method: 'POST',
+        headers: {
+          'Content-Type': 'application/json',
+        },
+        body: JSON.stringify({ questionNumber: currentQuestion + 1 })
+      });
+      
+      if (urlResponse.status === 404) {
+        directUploadRef.current = false;
+        return false;
+      }
+      if (!urlResponse.ok) {
+        return false;
+      }
+      
+      const { url } = await urlResponse.json();
+      const uploadResponse = await fetch(url, {
+        method: 'PUT',
+        headers: {
+          'Content-Type': 'video/webm',
+        },
+        body: blob
+      });
+      
+      if (uploadResponse.ok) {
+        console.log('Recording uploaded directly for question', currentQuestion + 1);
+      }
+      return uploadResponse.ok;
+    } catch (error) {
+      console.warn('Direct upload failed, falling back to backend upload:', error);
+      return false;
+    }
+  };
+
   const saveRecording = async (blob) => {
     try {
       setIsProcessing(true);
       setProcessingMessage('Saving recording...');
       
+      if (directUploadRef.current && await uploadRecordingDirect(blob)) {
+        setProcessingMessage('Recording saved! Moving to next question...');
+        setTimeout(() => {
+          setIsProcessing(false);
+          setProcessingMessage('');
+          moveToNextQuestion();
+        }, 2000);
+        return;
+      }
+      
       const formData = new FormData();
       // Send as webm (browser format), backend will convert to mp4
       formData.append('audio', blob, `question_${currentQuestion + 1}.webm`);
@@ -300,7 +364,7 @@ export default function InterviewPage() {
           }
         }
         
-        const response = await fetch('http://localhost:5000/api/analyze-recordings', {
+        const response = await fetch('http://localhost:5000/api/analyze-recordings-stream', {
           method: 'POST',
           headers: {
             'Content-Type': 'application/json',
@@ -308,8 +372,35 @@ export default function InterviewPage() {
           body: JSON.stringify(requestBody)
         });
         
-        if (response.ok) {
-          const result = await response.json();
+        // Progress arrives as Server-Sent Events while the backend works through the recordings
+        let result = null;
+        let analysisFailed = !response.ok || !response.body;
+        if (!analysisFailed) {
+          const stageLabels = {
+            body_language: 'body language',
+            speech_confidence: 'speech confidence',
+            speech_modulation: 'speech modulation'
+          };
+          const answerLabel = (video) => `answer ${video.split('_').pop()}`;
+          
+          await readServerSentEvents(response, (eventType, data) => {
+            if (eventType === 'stage') {
+              setProcessingMessage(`Finished ${stageLabels[data.stage] || data.stage} analysis for ${answerLabel(data.video)}...`);
+            } else if (eventType === 'feedback') {
+              setProcessingMessage(`Feedback ready for ${answerLabel(data.video)}...`);
+            } else if (eventType === 'overall_feedback') {
+              setProcessingMessage('Overall feedback ready...');
+            } else if (eventType === 'done') {
+              result = data;
+            } else if (eventType === 'error') {
+              result = data;
+              analysisFailed = true;
+            }
+          });
+          analysisFailed = analysisFailed || result === null;
+        }
+        
+        if (!analysisFailed) {
           console.log('Analysis complete:', result);
           
           // Hide loading overlay - overall feedback is already generated on backend
@@ -339,7 +430,7 @@ export default function InterviewPage() {
           // Navigate to feedback page
           navigate('/feedback');
         } else {
-          const error = await response.json();
+          const error = result || await response.json().catch(() => ({}));
           console.error('Analysis failed:', error);
           setIsAnalyzing(false);
           setIsProcessing(false);
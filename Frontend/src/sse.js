@@ -0,0 +1,30 @@
+// Read a Server-Sent Events stream from a fetch() response.
+// EventSource only supports GET, so the POST endpoints are consumed this way.
+export async function readServerSentEvents(response, onEvent) {
+  const reader = response.body.getReader();
+  const decoder = new TextDecoder();
+  let buffer = '';
+
+  while (true) {
+    const { done, value } = await reader.read();
+    if (done) break;
+    buffer += decoder.decode(value, { stream: true });
+
+    let boundary;
+    while ((boundary = buffer.indexOf('\n\n')) !== -1) {
+      const rawEvent = buffer.slice(0, boundary);
+      buffer = buffer.slice(boundary + 2);
+
+      let eventType = 'message';
+      let eventData = '';
+      for (const line of rawEvent.split('\n')) {
+        if (line.startsWith('event: ')) eventType = line.slice(7);
+        else if (line.startsWith('data: ')) eventData += line.slice(6);
+      }
+
+      if (eventData) {
+        onEvent(eventType, JSON.parse(eventData));
+      }
+    }
+  }
+}
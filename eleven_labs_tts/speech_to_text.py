@@ -13,16 +13,39 @@ from elevenlabs.client import ElevenLabs
 import subprocess
 import json
 import requests  # For direct API calls
+from requests.adapters import HTTPAdapter
+import mimetypes
+
+try:
+    from requests_toolbelt.multipart.encoder import MultipartEncoder
+except ImportError:
+    # Optional: without it, requests builds the whole multipart body in memory
+    MultipartEncoder = None
+
+# Shared cache and ffmpeg helpers live in the repository root, which is on the path when
+# running the server or this module with "python -m" from the repository root
+from file_cache import evict_lru, file_digest, read_entry, write_atomic
+from speech_audio import AUDIO_UPLOAD_ARGS
 
 # Load environment variables from .env file
 load_dotenv()
 
+# Transcripts of previously seen files, keyed by content hash and language; the
+# least recently used entries are evicted beyond this count
+TRANSCRIPT_CACHE_MAX_ENTRIES = 100
+# Cached transcripts are transcribed again after a week, e.g. to pick up model improvements
+TRANSCRIPT_CACHE_TTL = 7 * 24 * 60 * 60
+
 
 class SpeechToText:
     """
     A class to handle speech-to-text conversion using ElevenLabs Scribe API.
     """
     
+    # The SDK doesn't support speech-to-text yet, so the REST API is called directly
+    STT_URL = "https://api.elevenlabs.io/v1/speech-to-text"
+    STT_MODEL_ID = "scribe_v2"
+    
     def __init__(self, api_key: str = None):
         """
         Initialize the SpeechToText client.
@@ -42,9 +65,16 @@ class SpeechToText:
         # Initialize the ElevenLabs client
         self.client = ElevenLabs(api_key=self.api_key)
         
+        # Persistent session so repeated transcriptions reuse the TCP/TLS connection
+        self.session = requests.Session()
+        self.session.mount("https://", HTTPAdapter(pool_connections=16, pool_maxsize=16))
+        self.session.headers["xi-api-key"] = self.api_key
+        
         # Set output directory for transcripts
         self.output_dir = Path(os.getenv("OUTPUT_DIR", "output"))
         self.output_dir.mkdir(exist_ok=True)
+        self.cache_dir = self.output_dir / ".cache"
+        self.cache_dir.mkdir(exist_ok=True)
     
     def extract_audio_from_video(self, video_path: str, audio_path: str = None) -> str:
         """
@@ -52,7 +82,7 @@ class SpeechToText:
         
         Args:
             video_path (str): Path to the video file
-            audio_path (str, optional): Path for the extracted audio file
+            audio_path (str, optional): Path for the extracted audio file (Ogg Opus)
         
         Returns:
             str: Path to the extracted audio file
@@ -64,7 +94,7 @@ class SpeechToText:
         
         # Generate audio path if not provided
         if not audio_path:
-            audio_path = self.output_dir / f"{video_path.stem}_audio.mp3"
+            audio_path = self.output_dir / f"{video_path.stem}_audio.ogg"
         
         audio_path = Path(audio_path)
         
@@ -74,10 +104,11 @@ class SpeechToText:
             # Use ffmpeg to extract audio
             command = [
                 'ffmpeg',
+                '-hide_banner', '-nostats',  # Keep captured stderr to errors/warnings
                 '-i', str(video_path),
                 '-vn',  # No video
-                '-acodec', 'libmp3lame',  # MP3 codec
-                '-q:a', '2',  # High quality
+                # Mono, loudness-normalized, 16 kHz Opus (same audio as the modulation analysis)
+                *AUDIO_UPLOAD_ARGS,
                 '-y',  # Overwrite output file
                 str(audio_path)
             ]
@@ -125,6 +156,20 @@ class SpeechToText:
         if not file_path.exists():
             raise FileNotFoundError(f"File not found: {file_path}")
         
+        # A file with identical contents was transcribed before: skip extraction and upload
+        cache_file = self.cache_dir / f"{file_digest(file_path)}_{language}.txt"
+        cached_text = read_entry(cache_file, TRANSCRIPT_CACHE_TTL)
+        if cached_text is not None:
+            print(f"Reusing earlier transcription of identical file: {file_path.name}")
+            result = {
+                'text': cached_text.decode('utf-8'),
+                'file': str(file_path),
+                'language': language,
+                'timestamps_included': include_timestamps
+            }
+            self._save_transcription(result, file_path.stem, output_format)
+            return result
+        
         # Extract audio if it's a video file
         if file_path.suffix.lower() in ['.mp4', '.avi', '.mov', '.mkv', '.webm']:
             print(f"Detected video file: {file_path.name}")
@@ -140,31 +185,32 @@ class SpeechToText:
         try:
             # Open and read the audio file
             with open(file_to_transcribe, 'rb') as audio_file:
-                # Use ElevenLabs Scribe API via direct REST API call
-                # The SDK doesn't support speech-to-text yet, so we use requests
-                import requests
-                
-                url = "https://api.elevenlabs.io/v1/speech-to-text"
-                
-                headers = {
-                    "xi-api-key": self.api_key
-                }
-                
-                files = {
-                    "file": audio_file
-                }
-                
+                # Use ElevenLabs Scribe API; the session carries the API key header
                 data = {
-                    "model_id": "scribe_v2",
+                    "model_id": self.STT_MODEL_ID,
                     "language": language
                 }
                 
                 print(f"Sending request to ElevenLabs API...")
-                response = requests.post(url, headers=headers, files=files, data=data)
+                if MultipartEncoder is not None:
+                    # Stream the file from disk in chunks instead of buffering it
+                    content_type = mimetypes.guess_type(audio_file.name)[0] or "application/octet-stream"
+                    body = MultipartEncoder(fields={
+                        **data,
+                        "file": (Path(audio_file.name).name, audio_file, content_type)
+                    })
+                    response = self.session.post(
+                        self.STT_URL,
+                        headers={"Content-Type": body.content_type},
+                        data=body
+                    )
+                else:
+                    response = self.session.post(self.STT_URL, files={"file": audio_file}, data=data)
                 
                 if response.status_code == 200:
                     transcription_data = response.json()
                     transcript_text = transcription_data.get('text', '')
+                    self._cache_transcript(cache_file, transcript_text)
                 else:
                     error_msg = f"API Error {response.status_code}: {response.text}"
                     raise Exception(error_msg)
@@ -189,6 +235,17 @@ class SpeechToText:
             print(f"\n✗ Error during transcription: {str(e)}")
             raise
     
+    def _cache_transcript(self, cache_file: Path, text: str):
+        """
+        Store a transcript and evict the least recently used cache entries.
+        
+        Args:
+            cache_file (Path): Cache entry path for the file and language
+            text (str): Transcribed text
+        """
+        write_atomic(cache_file, text.encode('utf-8'))
+        evict_lru(self.cache_dir, "*.txt", TRANSCRIPT_CACHE_MAX_ENTRIES, TRANSCRIPT_CACHE_TTL)
+    
     def _save_transcription(self, result: dict, base_name: str, output_format: str):
         """
         Save transcription to file in the specified format.
@@ -259,7 +316,7 @@ def main():
         else:
             print("\nNo file provided. Here's how to use the script:")
             print("\nExample usage:")
-            print("  python speech_to_text.py")
+            print("  python -m eleven_labs_tts.speech_to_text")
             print("\nOr in your own code:")
             print("  from speech_to_text import SpeechToText")
             print("  stt = SpeechToText()")
@@ -5,28 +5,44 @@ This script uses the ElevenLabs API to convert text into natural-sounding speech
 It supports multiple voices and provides options for saving audio files.
 """
 
+import hashlib
 import os
+import shutil
 from pathlib import Path
 from dotenv import load_dotenv
 from elevenlabs import VoiceSettings
 from elevenlabs.client import ElevenLabs
 
+# Shared cache helpers live in the repository root, which is on the path when
+# running the server or this module with "python -m" from the repository root
+from file_cache import evict_lru, temp_path, touch_entry
+
 # Load environment variables from .env file
 load_dotenv()
 
+# Model and encoding requested from ElevenLabs; both are part of the cache key
+TTS_MODEL_ID = "eleven_multilingual_v2"  # Use the latest multilingual model
+TTS_OUTPUT_FORMAT = "mp3_44100_128"
+
+# Previously generated audio, keyed by a hash of the text, voice and settings;
+# the least recently used entries are evicted beyond this count
+TTS_CACHE_MAX_ENTRIES = 100
+
 
 class TextToSpeech:
     """
     A class to handle text-to-speech conversion using ElevenLabs API.
     """
     
-    def __init__(self, api_key: str = None):
+    def __init__(self, api_key: str = None, httpx_client=None):
         """
         Initialize the TextToSpeech client.
         
         Args:
             api_key (str, optional): ElevenLabs API key. If not provided, 
                                      will be loaded from environment variable.
+            httpx_client (httpx.Client, optional): Shared HTTP client so connections
+                                     (and TLS sessions) are reused across calls.
         """
         self.api_key = api_key or os.getenv("ELEVENLABS_API_KEY")
         
@@ -37,7 +53,10 @@ class TextToSpeech:
             )
         
         # Initialize the ElevenLabs client
-        self.client = ElevenLabs(api_key=self.api_key)
+        if httpx_client is not None:
+            self.client = ElevenLabs(api_key=self.api_key, httpx_client=httpx_client)
+        else:
+            self.client = ElevenLabs(api_key=self.api_key)
         
         # Set default voice ID from environment or use Rachel as default
         self.default_voice_id = os.getenv("DEFAULT_VOICE_ID", "21m00Tcm4TlvDq8ikWAM")
@@ -45,6 +64,44 @@ class TextToSpeech:
         # Set output directory
         self.output_dir = Path(os.getenv("OUTPUT_DIR", "output"))
         self.output_dir.mkdir(exist_ok=True)
+        self.cache_dir = self.output_dir / ".cache"
+        self.cache_dir.mkdir(exist_ok=True)
+    
+    def _cache_path(self, text: str, voice_id: str, *settings) -> Path:
+        """
+        Cache entry path for one combination of text, voice and voice settings.
+        
+        Args:
+            text (str): The text to convert to speech
+            voice_id (str): Voice ID used
+            *settings: Voice settings passed to the API
+        
+        Returns:
+            Path: Location of the cached MP3 (which may not exist yet)
+        """
+        key = "|".join(map(str, (voice_id, TTS_MODEL_ID, TTS_OUTPUT_FORMAT, *settings, text)))
+        digest = hashlib.blake2b(key.encode("utf-8"), digest_size=16).hexdigest()
+        return self.cache_dir / f"{digest}.mp3"
+    
+    @staticmethod
+    def _link_or_copy(source: Path, destination: Path):
+        """
+        Hard-link source to destination (no extra disk space), copying across filesystems.
+        
+        The link or copy is made under a temporary name and renamed over the
+        destination, so a file being served is replaced without a missing gap.
+        """
+        partial_path = temp_path(destination.parent)
+        try:
+            partial_path.unlink()
+            try:
+                os.link(source, partial_path)
+            except OSError:
+                shutil.copyfile(source, partial_path)  # Raises too if source is gone
+            os.replace(partial_path, destination)
+        except BaseException:
+            partial_path.unlink(missing_ok=True)
+            raise
     
     def generate_speech(
         self,
@@ -87,6 +144,19 @@ class TextToSpeech:
         
         output_path = self.output_dir / output_filename
         
+        # Identical text, voice and settings were synthesized before: skip the API call
+        cache_path = self._cache_path(text, voice_id, stability, similarity_boost, style, use_speaker_boost)
+        try:
+            touch_entry(cache_path)  # Mark as recently used for eviction
+            self._link_or_copy(cache_path, output_path)
+            print(f"✓ Reused earlier audio: {output_path}")
+            return str(output_path)
+        except FileNotFoundError:
+            pass  # Not cached, or evicted concurrently
+        # One temporary file per writer: identical concurrent requests must not
+        # write into the same file
+        partial_path = temp_path(self.cache_dir)
+        
         print(f"Generating speech for: '{text[:50]}...'")
         print(f"Using voice ID: {voice_id}")
         
@@ -95,9 +165,9 @@ class TextToSpeech:
             response = self.client.text_to_speech.convert(
                 voice_id=voice_id,
                 optimize_streaming_latency="0",
-                output_format="mp3_44100_128",
+                output_format=TTS_OUTPUT_FORMAT,
                 text=text,
-                model_id="eleven_multilingual_v2",  # Use the latest multilingual model
+                model_id=TTS_MODEL_ID,
                 voice_settings=VoiceSettings(
                     stability=stability,
                     similarity_boost=similarity_boost,
@@ -106,16 +176,20 @@ class TextToSpeech:
                 ),
             )
             
-            # Save the audio file
-            with open(output_path, "wb") as f:
-                for chunk in response:
-                    if chunk:
-                        f.write(chunk)
+            # Save the audio file. A 1 MiB buffer turns the many small HTTP chunks
+            # into a few large writes; the temporary name keeps a failed download
+            # from being mistaken for finished audio
+            with open(partial_path, "wb", buffering=1 << 20) as f:
+                f.writelines(response)
+            os.replace(partial_path, cache_path)
+            self._link_or_copy(cache_path, output_path)
+            evict_lru(self.cache_dir, "*.mp3", TTS_CACHE_MAX_ENTRIES)
             
             print(f"✓ Audio saved to: {output_path}")
             return str(output_path)
             
         except Exception as e:
+            partial_path.unlink(missing_ok=True)
             print(f"✗ Error generating speech: {str(e)}")
             raise
     
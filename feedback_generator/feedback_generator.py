@@ -47,8 +47,9 @@ class InterviewFeedbackGenerator:
         question_text: str,
         speech_confidence_json_path: str,
         body_language_json_path: str,
-        eye_contact_json_path: str,
-        modulation_json_path: str
+        eye_contact_json_path: Optional[str],
+        modulation_json_path: str,
+        eye_contact_data: Optional[Dict] = None
     ) -> Dict[str, List[str]]:
         """
         Generate feedback based on all analysis results.
@@ -59,8 +60,9 @@ class InterviewFeedbackGenerator:
             question_text: The interview question that was answered
             speech_confidence_json_path: Path to speech confidence analysis JSON
             body_language_json_path: Path to body language analysis JSON
-            eye_contact_json_path: Path to eye contact analysis JSON
+            eye_contact_json_path: Path to eye contact analysis JSON (may be None if eye_contact_data is given)
             modulation_json_path: Path to speech modulation analysis JSON
+            eye_contact_data: Eye contact analysis results, used instead of reading eye_contact_json_path
         
         Returns:
             A dictionary with feedback containing 4 bullet points in JSON format
@@ -68,7 +70,8 @@ class InterviewFeedbackGenerator:
         # Load all JSON files
         speech_data = self._load_json(speech_confidence_json_path)
         body_language_data = self._load_json(body_language_json_path)
-        eye_contact_data = self._load_json(eye_contact_json_path)
+        if eye_contact_data is None:
+            eye_contact_data = self._load_json(eye_contact_json_path)
         modulation_data = self._load_json(modulation_json_path)
         
         # Create prompt with all the data
@@ -0,0 +1,134 @@
+"""
+Helpers for the content-addressed file caches of the analysis and ElevenLabs modules.
+
+Each cache is a directory of files named after a content hash. Entries are
+published atomically (temporary file + os.replace), so concurrent readers
+never see a partially written entry, and eviction tolerates entries removed
+concurrently by other threads or worker processes.
+
+An entry's mtime records when it was written (for the TTL) and its atime when
+it was last used (for LRU eviction).
+"""
+
+import hashlib
+import os
+import tempfile
+import time
+from pathlib import Path
+from typing import Optional
+
+
+def file_digest(path) -> str:
+    """BLAKE2b hex digest of a file's contents, read in 1 MiB chunks."""
+    digest = hashlib.blake2b(digest_size=16)
+    with open(path, "rb") as f:
+        while chunk := f.read(1 << 20):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def temp_path(directory) -> Path:
+    """
+    Create a uniquely named empty ".part" file for one writer.
+
+    Args:
+        directory: Directory the file is created in (same filesystem as its final name)
+
+    Returns:
+        Path of the new file
+    """
+    fd, path = tempfile.mkstemp(dir=directory, suffix=".part")
+    os.close(fd)
+    os.chmod(path, 0o644)  # mkstemp's 0600 would hide published files from a proxy serving them
+    return Path(path)
+
+
+def write_atomic(path, data: bytes):
+    """
+    Write a file through a temporary name, so readers see either the old or the new contents.
+
+    Args:
+        path: Destination file
+        data: File contents
+    """
+    path = Path(path)
+    partial_path = temp_path(path.parent)
+    try:
+        partial_path.write_bytes(data)
+        os.replace(partial_path, path)
+    except BaseException:
+        partial_path.unlink(missing_ok=True)
+        raise
+
+
+def touch_entry(path):
+    """
+    Mark a cache entry as recently used, keeping its write time.
+
+    Raises:
+        FileNotFoundError: If the entry does not exist (or was just evicted)
+    """
+    os.utime(path, (time.time(), os.stat(path).st_mtime))
+
+
+def has_entry(path, max_age: Optional[float] = None) -> bool:
+    """
+    Check for an unexpired cache entry without marking it as used.
+
+    Args:
+        path: Cache entry
+        max_age: Seconds after being written at which the entry expires (None: never)
+    """
+    try:
+        written = os.stat(path).st_mtime
+    except FileNotFoundError:
+        return False
+    return max_age is None or time.time() - written <= max_age
+
+
+def read_entry(path, max_age: Optional[float] = None) -> Optional[bytes]:
+    """
+    Read a cache entry and mark it as recently used.
+
+    Args:
+        path: Cache entry
+        max_age: Seconds after being written at which the entry expires (None: never)
+
+    Returns:
+        The entry's contents, or None if it is missing or expired
+    """
+    try:
+        written = os.stat(path).st_mtime
+        if max_age is not None and time.time() - written > max_age:
+            return None
+        data = Path(path).read_bytes()
+        os.utime(path, (time.time(), written))
+    except FileNotFoundError:
+        return None
+    return data
+
+
+def evict_lru(directory, pattern: str, max_entries: int, max_age: Optional[float] = None):
+    """
+    Remove expired entries, then the least recently used ones beyond max_entries.
+
+    Args:
+        directory: Cache directory
+        pattern: Glob pattern of the cache entries
+        max_entries: Number of most recently used entries to keep
+        max_age: Seconds after being written at which entries expire (None: never)
+    """
+    now = time.time()
+    entries = []
+    for path in Path(directory).glob(pattern):
+        try:
+            stat = path.stat()
+        except FileNotFoundError:
+            continue  # Evicted concurrently by another thread or worker
+        if max_age is not None and now - stat.st_mtime > max_age:
+            path.unlink(missing_ok=True)
+        else:
+            entries.append((stat.st_atime, path))
+    entries.sort(reverse=True)
+    for _, stale in entries[max_entries:]:
+        stale.unlink(missing_ok=True)
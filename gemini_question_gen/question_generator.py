@@ -3,11 +3,99 @@ Module to generate HR and situational interview questions using Google Gemini AP
 """
 
 import os
+import re
 import json
-from typing import Dict, List
+import logging
+import threading
+import time
+from datetime import timedelta
+from typing import Dict, Iterator, List, Tuple
 import google.generativeai as genai
 
 
+logger = logging.getLogger(__name__)
+
+GEMINI_MODEL = "gemini-2.5-flash"
+
+# Static instructions for question generation. Kept byte-stable (no per-request
+# interpolation) so Gemini can reuse the cached prefix across requests; only the
+# company name and job description are sent per call.
+QUESTION_SYSTEM_INSTRUCTION = """You generate interview questions. Each request gives a company name and a job description. Generate exactly 2 interview questions for a job interview at that company for that position.
+
+First, infer the seniority level of the role (e.g., intern, entry-level, junior, intermediate, senior) based on the job description.
+Then, tailor the complexity, depth, and expectations of the questions to match that level:
+
+For intern or entry-level roles: keep questions concise, approachable, and focused on foundational skills, learning ability, coursework, projects, teamwork, and motivation. Avoid advanced technical depth, leadership-heavy scenarios, or highly abstract questions.
+
+For intermediate roles: include moderate depth, practical experience, and problem-solving responsibility.
+
+For senior roles: allow for deeper reflection, ownership, leadership, and strategic thinking.
+
+Make sure all questions are specific to the company and the responsibilities described, realistic for an actual interview, and clearly worded (not overly long or complex).
+
+Return a JSON object with exactly these fields:
+- "introduction": a list with one introduction question that asks the candidate to introduce themselves, tailored to the role level
+- "regular": a list with one regular HR question about skills, experience, or motivation, appropriate to the role level
+- "situational": an empty list
+
+Do not add explanations or extra text outside the JSON object."""
+
+# Explicit context caching (GEMINI_CONTEXT_CACHE=1) registers the instructions
+# once and refreshes the handle shortly before its TTL runs out
+CONTEXT_CACHE_TTL_SECONDS = int(os.getenv("GEMINI_CONTEXT_CACHE_TTL", 3600))
+CONTEXT_CACHE_REFRESH_MARGIN_SECONDS = 60
+
+
+# All three question buckets come back from a single structured-output call
+QUESTIONS_SCHEMA = {
+    "type": "object",
+    "properties": {
+        "introduction": {"type": "array", "items": {"type": "string"}},
+        "regular": {"type": "array", "items": {"type": "string"}},
+        "situational": {"type": "array", "items": {"type": "string"}},
+    },
+    "required": ["introduction", "regular", "situational"],
+}
+
+# Order in which questions are asked (and numbered)
+QUESTION_CATEGORIES = ("introduction", "regular", "situational")
+
+_ARRAY_START_RE = re.compile(r'"(introduction|regular|situational)"\s*:\s*\[')
+_JSON_DECODER = json.JSONDecoder()
+
+
+def _scan_question_arrays(buffer: str) -> Dict[str, Tuple[List[str], bool]]:
+    """
+    Extract the complete question strings from a partially streamed JSON response.
+    
+    Args:
+        buffer: JSON text received so far
+    
+    Returns:
+        Mapping of category -> (complete questions so far, whether the array is closed)
+    """
+    found = {}
+    for match in _ARRAY_START_RE.finditer(buffer):
+        items = []
+        closed = False
+        pos = match.end()
+        while True:
+            while pos < len(buffer) and buffer[pos] in " \t\r\n,":
+                pos += 1
+            if pos >= len(buffer):
+                break
+            if buffer[pos] == "]":
+                closed = True
+                break
+            try:
+                value, pos = _JSON_DECODER.raw_decode(buffer, pos)
+            except ValueError:
+                break  # String still being streamed
+            items.append(str(value).strip())
+        found[match.group(1)] = ([item for item in items if item], closed)
+    return found
+
+
 class InterviewQuestionGenerator:
     """
     A class to generate interview questions for a given company and job description.
@@ -34,7 +122,56 @@ class InterviewQuestionGenerator:
             )
         
         genai.configure(api_key=api_key)
-        self.model = genai.GenerativeModel("gemini-2.5-flash")
+        self.model = genai.GenerativeModel(GEMINI_MODEL)
+        self.questions_config = genai.GenerationConfig(
+            response_mime_type="application/json",
+            response_schema=QUESTIONS_SCHEMA
+        )
+        self.questions_model = genai.GenerativeModel(
+            GEMINI_MODEL,
+            system_instruction=QUESTION_SYSTEM_INSTRUCTION,
+            generation_config=self.questions_config
+        )
+        
+        self.use_context_cache = os.getenv("GEMINI_CONTEXT_CACHE", "0") == "1"
+        self._cached_model = None
+        self._cached_model_expires_at = 0.0
+        self._cache_lock = threading.Lock()
+    
+    def _get_questions_model(self) -> genai.GenerativeModel:
+        """
+        Return the model used for question generation.
+        
+        With GEMINI_CONTEXT_CACHE=1 the system instruction is registered as
+        CachedContent and the handle is recreated when its TTL is about to expire.
+        If caching is unavailable (e.g. the prompt is below the model's minimum
+        cacheable size) it is disabled and the plain model is used.
+        """
+        if not self.use_context_cache:
+            return self.questions_model
+        
+        with self._cache_lock:
+            if self._cached_model is None or time.monotonic() >= self._cached_model_expires_at:
+                try:
+                    cached_content = genai.caching.CachedContent.create(
+                        model=f"models/{GEMINI_MODEL}",
+                        display_name="interview-question-instructions",
+                        system_instruction=QUESTION_SYSTEM_INSTRUCTION,
+                        ttl=timedelta(seconds=CONTEXT_CACHE_TTL_SECONDS)
+                    )
+                    self._cached_model = genai.GenerativeModel.from_cached_content(
+                        cached_content,
+                        generation_config=self.questions_config
+                    )
+                    self._cached_model_expires_at = (
+                        time.monotonic() + CONTEXT_CACHE_TTL_SECONDS - CONTEXT_CACHE_REFRESH_MARGIN_SECONDS
+                    )
+                except Exception as e:
+                    logger.warning(f"Gemini context caching unavailable, using implicit caching: {e}")
+                    self.use_context_cache = False
+                    self._cached_model = None
+                    return self.questions_model
+            return self._cached_model
     
     def generate_questions(self, company_name: str, job_description: str) -> Dict[str, List[str]]:
         """
@@ -49,14 +186,80 @@ class InterviewQuestionGenerator:
         """
         prompt = self._create_prompt(company_name, job_description)
         
-        response = self.model.generate_content(prompt)
-        questions = self._parse_response(response.text)
+        response = self._get_questions_model().generate_content(prompt)
+        questions = self._parse_json_response(response.text)
         
         return questions
     
+    def stream_questions(self, company_name: str, job_description: str) -> Iterator[Tuple[str, str]]:
+        """
+        Generate interview questions, yielding each one as soon as Gemini has streamed it.
+        
+        Questions are yielded in QUESTION_CATEGORIES order, so callers can number
+        them as they arrive.
+        
+        Args:
+            company_name: Name of the company
+            job_description: Description of the job position
+        
+        Yields:
+            (category, question_text) tuples
+        """
+        prompt = self._create_prompt(company_name, job_description)
+        response = self._get_questions_model().generate_content(prompt, stream=True)
+        
+        buffer = ""
+        emitted = dict.fromkeys(QUESTION_CATEGORIES, 0)
+        cursor = 0
+        
+        for chunk in response:
+            buffer += chunk.text
+            found = _scan_question_arrays(buffer)
+            
+            # Only move on to the next category once the current array is closed
+            while cursor < len(QUESTION_CATEGORIES):
+                category = QUESTION_CATEGORIES[cursor]
+                items, closed = found.get(category, ([], False))
+                for text in items[emitted[category]:]:
+                    yield category, text
+                emitted[category] = len(items)
+                if not closed:
+                    break
+                cursor += 1
+        
+        # Flush anything the incremental scan could not attribute
+        questions = self._parse_json_response(buffer)
+        for category in QUESTION_CATEGORIES[cursor:]:
+            for text in questions[category][emitted[category]:]:
+                yield category, text
+    
+    def is_same_role(self, first_setup: str, second_setup: str) -> bool:
+        """
+        Ask Gemini whether two company/job description pairs describe the same role.
+        Used to confirm borderline semantic cache matches.
+        
+        Args:
+            first_setup: Company name and job description of the cached entry
+            second_setup: Company name and job description of the new request
+        
+        Returns:
+            True if the model answers that both describe the same role
+        """
+        prompt = f"""Do the following two job postings describe the same role at the same company, such that the same interview questions would apply to both? Answer with only YES or NO.
+
+POSTING A:
+{first_setup}
+
+POSTING B:
+{second_setup}"""
+        
+        response = self.model.generate_content(prompt)
+        return response.text.strip().upper().startswith("YES")
+    
     def _create_prompt(self, company_name: str, job_description: str) -> str:
         """
-        Create the prompt for Gemini API.
+        Create the per-request part of the prompt.
+        The instructions are sent separately as QUESTION_SYSTEM_INSTRUCTION.
         
         Args:
             company_name: Name of the company
@@ -65,33 +268,34 @@ class InterviewQuestionGenerator:
         Returns:
             A formatted prompt string
         """
-        prompt = f"""Generate exactly 2 interview questions for a job interview at {company_name} for the following position:
+        return f"""Company: {company_name}
 
 Job Description:
-{job_description}
-
-First, infer the seniority level of the role (e.g., intern, entry-level, junior, intermediate, senior) based on the job description.
-Then, tailor the complexity, depth, and expectations of the questions to match that level:
-
-For intern or entry-level roles: keep questions concise, approachable, and focused on foundational skills, learning ability, coursework, projects, teamwork, and motivation. Avoid advanced technical depth, leadership-heavy scenarios, or highly abstract questions.
-
-For intermediate roles: include moderate depth, practical experience, and problem-solving responsibility.
-
-For senior roles: allow for deeper reflection, ownership, leadership, and strategic thinking.
-
-Make sure all questions are specific to {company_name} and the responsibilities described, realistic for an actual interview, and clearly worded (not overly long or complex).
-
-Provide the questions in exactly the following format and structure:
-
-QUESTION 1 (INTRODUCTION):
-[One introduction question that asks the candidate to introduce themselves, tailored to the role level]
-
-QUESTION 2 (REGULAR):
-[One regular HR question about skills, experience, or motivation, appropriate to the role level]
-
-Do not add explanations, headers, or extra text outside the two questions."""
+{job_description}"""
+    
+    def _parse_json_response(self, response_text: str) -> Dict[str, List[str]]:
+        """
+        Parse the structured (JSON) API response.
+        Falls back to the line-based parser if the model did not return JSON.
+        
+        Args:
+            response_text: Raw response text from Gemini API
+        
+        Returns:
+            Dictionary with question categories and their questions
+        """
+        try:
+            data = json.loads(response_text)
+        except json.JSONDecodeError:
+            return self._parse_response(response_text)
         
-        return prompt
+        if not isinstance(data, dict):
+            return self._parse_response(response_text)
+        
+        return {
+            category: [str(q).strip() for q in data.get(category) or [] if str(q).strip()]
+            for category in QUESTION_CATEGORIES
+        }
     
     def _parse_response(self, response_text: str) -> Dict[str, List[str]]:
         """
@@ -0,0 +1,181 @@
+"""
+Semantic cache for generated interview questions.
+
+Two postings for the same role often differ only in boilerplate, so an
+exact-match cache misses them. This cache embeds the job description with a
+sentence-transformers model and reuses the questions of the most similar
+previously seen setup of the same company (an exact scope match, since
+questions are company-specific) when the cosine similarity is high enough.
+"""
+
+import threading
+from collections import OrderedDict
+from typing import Any, Callable, Optional
+
+try:
+    import numpy as np
+    from sentence_transformers import SentenceTransformer
+except ImportError:
+    # Optional dependency - the cache simply stays disabled without it
+    np = None
+    SentenceTransformer = None
+
+# Number of recent query embeddings kept for the add() that follows a miss
+RECENT_QUERY_EMBEDDINGS = 64
+
+
+class SemanticQuestionCache:
+    """
+    Cosine-similarity cache in front of question generation.
+    
+    Embeddings are L2-normalized and kept in a pre-allocated float32 matrix,
+    so a lookup is a single matrix-vector product followed by an argmax over
+    the entries of the query's scope (e.g. the normalized company name).
+    
+    - score >= hit_threshold: cached payload is returned directly
+    - verify_threshold <= score < hit_threshold: payload is returned only if
+      the optional verifier confirms both setups describe the same role
+    - otherwise: miss
+    """
+    
+    def __init__(
+        self,
+        model_name: str = "sentence-transformers/all-MiniLM-L6-v2",
+        hit_threshold: float = 0.92,
+        verify_threshold: float = 0.80,
+        max_entries: int = 4096,
+        verifier: Optional[Callable[[str, str], bool]] = None
+    ):
+        """
+        Initialize the cache. The embedding model is loaded on first use.
+        
+        Args:
+            model_name: sentence-transformers model used for embeddings
+            hit_threshold: Similarity at or above which a cached entry is reused
+            verify_threshold: Lower bound of the gray zone that needs verification
+            max_entries: Maximum number of cached setups (oldest are overwritten)
+            verifier: Optional callable(cached_text, query_text) -> bool for the gray zone
+        """
+        self.enabled = SentenceTransformer is not None
+        self.model_name = model_name
+        self.hit_threshold = hit_threshold
+        self.verify_threshold = verify_threshold
+        self.max_entries = max_entries
+        self.verifier = verifier
+        
+        self._model = None
+        self._model_lock = threading.Lock()
+        self._lock = threading.Lock()
+        self._embeddings = None  # (capacity, dim) float32 buffer
+        self._slot_scopes = None  # (capacity,) scope id of each slot
+        self._scope_ids = {}  # scope -> id
+        self._texts = []
+        self._payloads = []
+        self._count = 0  # Total entries ever added; slot = count % max_entries
+        # Embeddings of recent lookups: after a miss, the caller generates the
+        # questions and add()s the same text, which then needs no second encoder pass
+        self._recent_queries = OrderedDict()
+    
+    def _get_model(self):
+        """Load the embedding model once (double-checked locking)."""
+        if self._model is None:
+            with self._model_lock:
+                if self._model is None:
+                    self._model = SentenceTransformer(self.model_name)
+        return self._model
+    
+    def warm_up(self):
+        """Load the embedding model ahead of the first request."""
+        if self.enabled:
+            self._get_model()
+    
+    def _embed(self, text: str):
+        """Embed text as a normalized float32 vector, reusing recent embeddings."""
+        with self._lock:
+            vector = self._recent_queries.get(text)
+        if vector is not None:
+            return vector
+        
+        vector = self._get_model().encode(text, normalize_embeddings=True, convert_to_numpy=True)
+        vector = vector.astype(np.float32, copy=False)
+        with self._lock:
+            self._recent_queries[text] = vector
+            if len(self._recent_queries) > RECENT_QUERY_EMBEDDINGS:
+                self._recent_queries.popitem(last=False)
+        return vector
+    
+    def lookup(self, text: str, scope: str = "") -> Optional[Any]:
+        """
+        Find the cached payload for a near-duplicate setup.
+        
+        Args:
+            text: Query text (job description)
+            scope: Only entries added with this exact scope can match
+        
+        Returns:
+            The cached payload, or None on a miss
+        """
+        if not self.enabled:
+            return None
+        
+        query = self._embed(text)
+        
+        with self._lock:
+            size = min(self._count, self.max_entries)
+            scope_id = self._scope_ids.get(scope)
+            if size == 0 or scope_id is None:
+                return None
+            scores = self._embeddings[:size] @ query
+            scores[self._slot_scopes[:size] != scope_id] = -np.inf
+            best = int(np.argmax(scores))
+            score = float(scores[best])
+            cached_text = self._texts[best]
+            payload = self._payloads[best]
+        
+        if score >= self.hit_threshold:
+            return payload
+        if score >= self.verify_threshold and self.verifier is not None:
+            if self.verifier(cached_text, text):
+                return payload
+        return None
+    
+    def add(self, text: str, payload: Any, scope: str = ""):
+        """
+        Store a payload for the given setup text.
+        
+        Args:
+            text: Query text (job description)
+            payload: Value returned by future lookups that match this text
+            scope: Scope the entry can be matched in
+        """
+        if not self.enabled:
+            return
+        
+        vector = self._embed(text)
+        
+        with self._lock:
+            slot = self._count % self.max_entries
+            
+            if self._embeddings is None:
+                capacity = min(64, self.max_entries)
+                self._embeddings = np.empty((capacity, vector.shape[0]), dtype=np.float32)
+                self._slot_scopes = np.empty(capacity, dtype=np.int64)
+            elif slot >= self._embeddings.shape[0]:
+                # Grow geometrically so appends are amortized O(1)
+                capacity = min(self._embeddings.shape[0] * 2, self.max_entries)
+                grown = np.empty((capacity, vector.shape[0]), dtype=np.float32)
+                grown[:slot] = self._embeddings[:slot]
+                self._embeddings = grown
+                grown_scopes = np.empty(capacity, dtype=np.int64)
+                grown_scopes[:slot] = self._slot_scopes[:slot]
+                self._slot_scopes = grown_scopes
+            
+            self._embeddings[slot] = vector
+            self._slot_scopes[slot] = self._scope_ids.setdefault(scope, len(self._scope_ids))
+            if slot < len(self._texts):
+                self._texts[slot] = text
+                self._payloads[slot] = payload
+            else:
+                self._texts.append(text)
+                self._payloads.append(payload)
+            self._count += 1
@@ -0,0 +1,44 @@
+"""
+Gunicorn configuration for the interview preparation API.
+
+Each request spends most of its time waiting on Gemini, ElevenLabs or
+AssemblyAI, so threaded workers keep many requests in flight per process.
+gevent workers are not used: google-generativeai talks to Gemini over gRPC,
+which does not cooperate with gevent's monkey-patching.
+"""
+
+import multiprocessing
+import os
+import sys
+
+bind = f"0.0.0.0:{os.environ.get('PORT', '5000')}"
+worker_class = "gthread"
+workers = int(os.environ.get("WEB_CONCURRENCY", min(4, multiprocessing.cpu_count())))
+threads = int(os.environ.get("GUNICORN_THREADS", "16"))
+
+# Recording analysis chains ffmpeg and several API calls; matches nginx's
+# proxy_read_timeout so long analyses are not killed mid-request
+timeout = int(os.environ.get("GUNICORN_TIMEOUT", "600"))
+keepalive = 5
+
+# Import the app once in the master so model weights and API clients are
+# shared copy-on-write by all forked workers
+preload_app = True
+
+
+def when_ready(server):
+    """Wait for server.py's background pre-warm before workers are forked."""
+    api_module = sys.modules.get("server")
+    if api_module is not None:
+        api_module.prewarm_thread.join()
+
+
+def post_fork(server, worker):
+    """Restart this worker's logging thread and warm its own HTTP connection pool."""
+    logging_config = sys.modules.get("logging_config")
+    if logging_config is not None:
+        logging_config.reconfigure_after_fork()
+    
+    api_module = sys.modules.get("server")
+    if api_module is not None:
+        api_module.preconnect()
@@ -0,0 +1,60 @@
+"""
+Logging setup shared by the CLI (main.py) and the Flask server (server.py).
+
+Records are pushed onto a queue by a QueueHandler and written to the console
+by a QueueListener running on a background thread, so request threads never
+block on stdout/stderr I/O.
+"""
+
+import atexit
+import logging
+import logging.handlers
+import os
+import queue
+
+_listener = None
+
+
+def configure_logging(default_level: str = "INFO", fmt: str = "%(asctime)s %(levelname)s %(name)s: %(message)s"):
+    """
+    Route all logging through a background QueueListener.
+    
+    Args:
+        default_level: Level used when the LOG_LEVEL environment variable is not set
+        fmt: Format string for the console handler
+    """
+    global _listener
+    
+    root = logging.getLogger()
+    root.setLevel(os.environ.get("LOG_LEVEL", default_level).upper())
+    
+    if _listener is not None:
+        return  # Already configured (e.g. module re-imported by the reloader)
+    
+    log_queue = queue.SimpleQueue()
+    console_handler = logging.StreamHandler()
+    console_handler.setFormatter(logging.Formatter(fmt))
+    
+    for handler in list(root.handlers):
+        root.removeHandler(handler)
+    root.addHandler(logging.handlers.QueueHandler(log_queue))
+    
+    _listener = logging.handlers.QueueListener(log_queue, console_handler, respect_handler_level=True)
+    _listener.start()
+    atexit.register(_listener.stop)
+
+
+def reconfigure_after_fork():
+    """
+    Start a new QueueListener in a forked child process.
+    
+    Threads do not survive fork(), so a listener started by a preloading parent
+    is dead in the child and nothing would drain the inherited queue.
+    """
+    global _listener
+    
+    if _listener is None:
+        return
+    atexit.unregister(_listener.stop)
+    _listener = None
+    configure_logging(default_level=logging.getLevelName(logging.getLogger().level))
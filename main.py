@@ -2,11 +2,13 @@
 Main module that generates interview questions using Gemini and converts them to voice using ElevenLabs TTS.
 """
 
+import logging
 import os
 import sys
-import shutil
+import time
 from pathlib import Path
 from dotenv import load_dotenv
+from logging_config import configure_logging
 
 # Load environment variables
 load_dotenv()
@@ -26,6 +28,44 @@ from confidence_analysis_module import analyze_speech
 from speech_modulation import SpeechModulationAnalyzer
 import json
 
+logger = logging.getLogger(__name__)
+
+
+def _log_banner(title: str):
+    """Log a section title, framed by separator lines when DEBUG logging is enabled."""
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug("=" * 60)
+    logger.info(title)
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug("=" * 60)
+
+
+# Recordings older than this are considered abandoned and may be swept
+STALE_RECORDING_AGE_SECONDS = 24 * 60 * 60
+
+
+def sweep_stale_recordings(recordings_dir: Path, max_age_seconds: float = STALE_RECORDING_AGE_SECONDS) -> int:
+    """
+    Delete browser recordings that have not been modified for max_age_seconds.
+    
+    Args:
+        recordings_dir: Directory holding the user_answer_*.webm uploads
+        max_age_seconds: Minimum age (by mtime) of a file before it is removed
+    
+    Returns:
+        Number of files deleted
+    """
+    cutoff = time.time() - max_age_seconds
+    deleted = 0
+    for file_path in recordings_dir.glob("*.webm"):
+        try:
+            if file_path.stat().st_mtime < cutoff:
+                os.unlink(file_path)
+                deleted += 1
+        except FileNotFoundError:
+            pass  # Removed concurrently
+    return deleted
+
 
 class InterviewPreparationSystem:
     """
@@ -39,11 +79,11 @@ class InterviewPreparationSystem:
         self.output_dir = Path(__file__).parent / "interview_output"
         self.output_dir.mkdir(exist_ok=True)
         
-        # Create or clear user_recordings directory
+        # Create user_recordings directory and drop only stale recordings;
+        # wiping the whole tree here would also destroy in-flight uploads
         self.user_recordings_dir = Path(__file__).parent / "user_recordings"
-        if self.user_recordings_dir.exists():
-            shutil.rmtree(self.user_recordings_dir)
         self.user_recordings_dir.mkdir(exist_ok=True)
+        sweep_stale_recordings(self.user_recordings_dir)
     
     def generate_and_convert_questions(self, company_name: str, job_description: str):
         """
@@ -53,12 +93,10 @@ class InterviewPreparationSystem:
             company_name: Name of the company
             job_description: Description of the job position
         """
-        print("=" * 60)
-        print("Interview Preparation System")
-        print("=" * 60)
-        print(f"\nCompany: {company_name}")
-        print(f"Position: {job_description[:50]}...")
-        print("\nGenerating questions...")
+        _log_banner("Interview Preparation System")
+        logger.info(f"Company: {company_name}")
+        logger.info(f"Position: {job_description[:50]}...")
+        logger.info("Generating questions...")
         
         # Generate questions using Gemini
         questions = self.question_generator.generate_questions(company_name, job_description)
@@ -68,14 +106,12 @@ class InterviewPreparationSystem:
             len(questions["regular"]) +
             len(questions["situational"])
         )
-        print(f"✓ Generated {total_questions} questions\n")
+        logger.info(f"✓ Generated {total_questions} questions")
         
         question_num = 1
         audio_files = []
         
-        print("=" * 60)
-        print("Generating Voice Recordings")
-        print("=" * 60 + "\n")
+        _log_banner("Generating Voice Recordings")
         
         # Process introduction question first
         if questions["introduction"]:
@@ -102,11 +138,9 @@ class InterviewPreparationSystem:
             audio_files.append(audio_file)
             question_num += 1
         
-        print("=" * 60)
-        print("✓ All voice recordings completed successfully!")
-        print("=" * 60)
-        print(f"\nAudio files saved to: {self.output_dir}")
-        print(f"Total files generated: {len(audio_files)}")
+        _log_banner("✓ All voice recordings completed successfully!")
+        logger.info(f"Audio files saved to: {self.output_dir}")
+        logger.info(f"Total files generated: {len(audio_files)}")
         
         return audio_files
     
@@ -122,8 +156,8 @@ class InterviewPreparationSystem:
         Returns:
             Path to the generated audio file
         """
-        print(f"Question {question_num} ({question_type}):")
-        print(f"{question_text}\n")
+        logger.info(f"Question {question_num} ({question_type}):")
+        logger.info(question_text)
         
         # Create filename
         safe_type = question_type.replace(" ", "_")
@@ -138,7 +172,6 @@ class InterviewPreparationSystem:
             stability=0.7,
             similarity_boost=0.75
         )
-        print()
         
         return str(output_path)
 
@@ -168,13 +201,10 @@ def analyze_interview_performance(video_path: str, audio_path: str = None):
         if not audio_path.exists():
             raise FileNotFoundError(f"Audio file not found: {audio_path}")
     
-    print("=" * 60)
-    print("Interview Performance Analysis")
-    print("=" * 60)
-    print(f"\nVideo: {video_path.name}")
+    _log_banner("Interview Performance Analysis")
+    logger.info(f"Video: {video_path.name}")
     if audio_path != video_path:
-        print(f"Audio: {audio_path.name}")
-    print()
+        logger.info(f"Audio: {audio_path.name}")
     
     output_dir = video_path.parent
     base_name = video_path.stem
@@ -182,52 +212,46 @@ def analyze_interview_performance(video_path: str, audio_path: str = None):
     results = {}
     
     # 1. Body Language Analysis
-    print("Analyzing body language...")
+    logger.info("Analyzing body language...")
     try:
         body_language_results = analyze_body_language(str(video_path))
         body_language_json = output_dir / f"{base_name}_body_language_analysis.json"
         with open(body_language_json, 'w') as f:
             json.dump(body_language_results, f, indent=2)
         results["body_language"] = str(body_language_json)
-        print(f"✓ Body language analysis saved to: {body_language_json.name}")
+        logger.info(f"✓ Body language analysis saved to: {body_language_json.name}")
     except Exception as e:
-        print(f"✗ Body language analysis failed: {e}")
+        logger.error(f"✗ Body language analysis failed: {e}")
         results["body_language"] = None
     
-    print()
-    
     # 2. Eye Contact Analysis
-    print("Analyzing eye contact...")
+    logger.info("Analyzing eye contact...")
     try:
         eye_contact_results = analyze_eye_contact(str(video_path))
         eye_contact_json = output_dir / f"{base_name}_eye_contact_analysis.json"
         with open(eye_contact_json, 'w') as f:
             json.dump(eye_contact_results, f, indent=2)
         results["eye_contact"] = str(eye_contact_json)
-        print(f"✓ Eye contact analysis saved to: {eye_contact_json.name}")
+        logger.info(f"✓ Eye contact analysis saved to: {eye_contact_json.name}")
     except Exception as e:
-        print(f"✗ Eye contact analysis failed: {e}")
+        logger.error(f"✗ Eye contact analysis failed: {e}")
         results["eye_contact"] = None
     
-    print()
-    
     # 3. Speech Confidence Analysis
-    print("Analyzing speech confidence...")
+    logger.info("Analyzing speech confidence...")
     try:
         speech_results = analyze_speech(str(audio_path))
         speech_json = output_dir / f"{base_name}_speech_confidence_analysis.json"
         with open(speech_json, 'w') as f:
             json.dump(speech_results, f, indent=2)
         results["speech_confidence"] = str(speech_json)
-        print(f"✓ Speech confidence analysis saved to: {speech_json.name}")
+        logger.info(f"✓ Speech confidence analysis saved to: {speech_json.name}")
     except Exception as e:
-        print(f"✗ Speech confidence analysis failed: {e}")
+        logger.error(f"✗ Speech confidence analysis failed: {e}")
         results["speech_confidence"] = None
     
-    print()
-    
     # 4. Speech Modulation Analysis
-    print("Analyzing speech modulation...")
+    logger.info("Analyzing speech modulation...")
     try:
         modulation_analyzer = SpeechModulationAnalyzer()
         # Temporarily set output_dir to save in same location as other analyses
@@ -239,21 +263,18 @@ def analyze_interview_performance(video_path: str, audio_path: str = None):
         # Restore original output_dir
         modulation_analyzer.output_dir = original_output_dir
         results["speech_modulation"] = str(modulation_json)
-        print(f"✓ Speech modulation analysis saved to: {modulation_json.name}")
+        logger.info(f"✓ Speech modulation analysis saved to: {modulation_json.name}")
     except Exception as e:
-        print(f"✗ Speech modulation analysis failed: {e}")
+        logger.error(f"✗ Speech modulation analysis failed: {e}")
         results["speech_modulation"] = None
     
-    print()
-    print("=" * 60)
-    print("Analysis Complete!")
-    print("=" * 60)
-    print(f"\nGenerated JSON files:")
+    _log_banner("Analysis Complete!")
+    logger.info("Generated JSON files:")
     for analysis_type, file_path in results.items():
         if file_path:
-            print(f"  - {analysis_type}: {Path(file_path).name}")
+            logger.info(f"  - {analysis_type}: {Path(file_path).name}")
         else:
-            print(f"  - {analysis_type}: Failed")
+            logger.info(f"  - {analysis_type}: Failed")
     
     return results
 
@@ -274,16 +295,15 @@ def main():
         system.generate_and_convert_questions(company_name, job_description)
         
     except ValueError as e:
-        print(f"\n✗ Configuration Error: {e}")
-        print("\nPlease ensure:")
-        print("1. GEMINI_API_KEY environment variable is set in .env")
-        print("2. ELEVENLABS_API_KEY environment variable is set in .env")
-        print("3. Both API keys are valid")
+        logger.error(f"✗ Configuration Error: {e}")
+        logger.info("Please ensure:")
+        logger.info("1. GEMINI_API_KEY environment variable is set in .env")
+        logger.info("2. ELEVENLABS_API_KEY environment variable is set in .env")
+        logger.info("3. Both API keys are valid")
     except Exception as e:
-        print(f"\n✗ Error: {e}")
-        import traceback
-        traceback.print_exc()
+        logger.exception(f"✗ Error: {e}")
 
 
 if __name__ == "__main__":
+    configure_logging(default_level="INFO", fmt="%(message)s")
     main()
@@ -0,0 +1,92 @@
+"""
+Persistent cache for LLM responses, shared by all server worker processes.
+
+Entries live in a small SQLite database (WAL mode, so readers in other
+workers are never blocked by a writer) and survive restarts, unlike the
+in-process TTL caches in server.py that sit in front of it.
+"""
+
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Optional
+
+
+class ResponseCache:
+    """
+    Key -> bytes store with per-entry age limits.
+    
+    Each thread gets its own SQLite connection; keys are expected to be
+    content hashes built by the caller (e.g. BLAKE2b of the prompt inputs).
+    """
+    
+    def __init__(self, db_path: Path, ttl_seconds: int):
+        """
+        Open (or create) the cache database.
+        
+        Args:
+            db_path: Path of the SQLite database file
+            ttl_seconds: Entries older than this are treated as misses
+        """
+        self.db_path = str(db_path)
+        self.ttl_seconds = ttl_seconds
+        self._local = threading.local()
+        
+        # Set up with a short-lived connection: connections must not be
+        # inherited by forked (preloaded) server workers
+        conn = sqlite3.connect(self.db_path, timeout=5)
+        try:
+            conn.execute("PRAGMA journal_mode=WAL")
+            with conn:
+                conn.execute(
+                    "CREATE TABLE IF NOT EXISTS cache ("
+                    "key TEXT PRIMARY KEY, response BLOB NOT NULL, ts INTEGER NOT NULL)"
+                )
+        finally:
+            conn.close()
+    
+    def _connect(self) -> sqlite3.Connection:
+        """Return this thread's connection, opening it on first use."""
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = sqlite3.connect(self.db_path, timeout=5)
+            conn.execute("PRAGMA synchronous=NORMAL")
+            self._local.conn = conn
+        return conn
+    
+    def get(self, key: str) -> Optional[bytes]:
+        """
+        Look up a cached response.
+        
+        Args:
+            key: Cache key
+        
+        Returns:
+            The cached bytes, or None if missing or expired
+        """
+        try:
+            row = self._connect().execute(
+                "SELECT response FROM cache WHERE key = ? AND ts >= ?",
+                (key, int(time.time()) - self.ttl_seconds)
+            ).fetchone()
+        except sqlite3.Error:
+            return None  # A broken cache must never fail the request
+        return row[0] if row else None
+    
+    def set(self, key: str, response: bytes):
+        """
+        Store a response, replacing any previous entry for the key.
+        
+        Args:
+            key: Cache key
+            response: Serialized response
+        """
+        try:
+            with self._connect() as conn:
+                conn.execute(
+                    "INSERT OR REPLACE INTO cache (key, response, ts) VALUES (?, ?, ?)",
+                    (key, response, int(time.time()))
+                )
+        except sqlite3.Error:
+            pass
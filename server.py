@@ -2,18 +2,61 @@
 Flask API server for the interview preparation system.
 """
 
-from flask import Flask, request, jsonify, send_file, send_from_directory
+from flask import Blueprint, Flask, Response, request, send_file, send_from_directory, stream_with_context
 from flask_cors import CORS
+from flask_compress import Compress
+import asyncio
+import atexit
+import contextlib
+import functools
+import hashlib
+import logging
 import os
+import queue
+import re
 import sys
+import threading
 import subprocess
 import shutil
+import tempfile
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from dotenv import load_dotenv
+from cachetools import TTLCache
+import httpx
+import orjson
+from logging_config import configure_logging
+from response_cache import ResponseCache
+from file_cache import file_digest
+
+try:
+    import fcntl
+except ImportError:  # Windows: analyses are then only serialized within one process
+    fcntl = None
+
+try:
+    import av
+except ImportError:
+    # Optional: without PyAV, audio extraction shells out to the ffmpeg CLI
+    av = None
 
 # Load environment variables
 load_dotenv()
 
+# One pooled HTTP/2 client shared by the ElevenLabs SDK, so every TTS call
+# reuses a warm keep-alive connection instead of a fresh TCP + TLS handshake.
+# (Gemini is reached over gRPC, which already keeps a persistent HTTP/2 channel.)
+HTTP = httpx.Client(
+    http2=True,
+    timeout=60,
+    limits=httpx.Limits(max_connections=100, max_keepalive_connections=100)
+)
+atexit.register(HTTP.close)
+
+# Production default is WARNING; set LOG_LEVEL=INFO/DEBUG for progress output
+configure_logging(default_level="WARNING")
+logger = logging.getLogger("server")
+
 # Add modules to path
 sys.path.insert(0, str(Path(__file__).parent / "gemini_question_gen"))
 sys.path.insert(0, str(Path(__file__).parent / "eleven_labs_tts"))
@@ -22,77 +65,500 @@ sys.path.insert(0, str(Path(__file__).parent / "confidence_analysis_module"))
 sys.path.insert(0, str(Path(__file__).parent / "speech_modulation"))
 sys.path.insert(0, str(Path(__file__).parent / "feedback_generator"))
 
-from question_generator import InterviewQuestionGenerator
-from text_to_speech import TextToSpeech
-from body_language_module.body_language_analyzer import analyze_body_language
-from confidence_analysis_module import analyze_speech
-from speech_modulation_analysis import SpeechModulationAnalyzer
+from question_generator import InterviewQuestionGenerator, QUESTION_CATEGORIES
+from semantic_cache import SemanticQuestionCache
 from feedback_generator import InterviewFeedbackGenerator
-import json
+# The TTS SDK and the recording analyzers (OpenCV/MediaPipe, the audio analysis
+# stack, AssemblyAI) are imported on first use - see get_tts_generator() and the
+# _load_* helpers - so workers that only serve questions start quickly
 
-app = Flask(__name__)
-CORS(app)  # Enable CORS for frontend
+# Routes live on blueprints; create_app() assembles them into the Flask app
+api = Blueprint('api', __name__)
+tts_api = Blueprint('tts', __name__)
+frontend = Blueprint('frontend', __name__)
 
-# Initialize question generator
-question_generator = InterviewQuestionGenerator()
+# Set ENABLE_TTS=0 to run without ElevenLabs (the frontend falls back to browser TTS)
+ENABLE_TTS = bool(int(os.environ.get('ENABLE_TTS', '1')))
 
-# Initialize TTS generator
-try:
-    tts_generator = TextToSpeech()
-except Exception as e:
-    print(f"Warning: Could not initialize TTS generator: {e}")
-    tts_generator = None
+def _json(obj, status: int = 200) -> Response:
+    """Serialize obj with orjson (C encoder) and wrap it in a JSON response."""
+    return Response(orjson.dumps(obj), status=status, mimetype='application/json')
 
 
-@app.route('/api/clear-recordings', methods=['POST'])
-def clear_recordings():
+# Session IDs become directory names under user_recordings and interview_feedback,
+# so keep them path-safe
+SESSION_ID_RE = re.compile(r'^[A-Za-z0-9_-]{1,64}$')
+
+# Resolved and created once at startup instead of on every upload
+RECORDINGS_DIR = Path(__file__).parent / "user_recordings"
+RECORDINGS_DIR.mkdir(exist_ok=True)
+FEEDBACK_DIR = Path(__file__).parent / "interview_feedback"
+FEEDBACK_DIR.mkdir(exist_ok=True)
+
+# Directory fd for openat()-style access: uploads are opened relative to this
+# inode instead of walking the full path on every request
+if os.open in os.supports_dir_fd and hasattr(os, 'O_DIRECTORY'):
+    _RECORDINGS_FD = os.open(RECORDINGS_DIR, os.O_RDONLY | os.O_DIRECTORY)
+    atexit.register(os.close, _RECORDINGS_FD)
+else:
+    _RECORDINGS_FD = None
+
+
+def get_recordings_dir(session_id: str = None) -> Path:
+    """
+    Resolve the recordings directory, optionally scoped to a session.
+    
+    Args:
+        session_id: Optional session ID; must match SESSION_ID_RE
+    
+    Returns:
+        user_recordings/ or user_recordings/<session_id>/
+    """
+    if session_id:
+        if not SESSION_ID_RE.match(session_id):
+            raise ValueError(f"Invalid sessionId: {session_id!r}")
+        return RECORDINGS_DIR / session_id
+    return RECORDINGS_DIR
+
+
+def get_feedback_dir(session_id: str = None) -> Path:
+    """
+    Resolve the feedback directory, scoped to a session like the recordings directory.
+    
+    Args:
+        session_id: Optional session ID; must match SESSION_ID_RE
+    
+    Returns:
+        interview_feedback/ or interview_feedback/<session_id>/
+    """
+    if session_id:
+        if not SESSION_ID_RE.match(session_id):
+            raise ValueError(f"Invalid sessionId: {session_id!r}")
+        return FEEDBACK_DIR / session_id
+    return FEEDBACK_DIR
+
+
+def ensure_session_dir(session_id: str = None):
+    """
+    Create user_recordings/<session_id>/ if needed (the base directory exists from startup).
+    
+    Args:
+        session_id: Session ID already validated by get_recordings_dir, or None
+    """
+    if not session_id:
+        return
+    try:
+        if _RECORDINGS_FD is not None:
+            os.mkdir(session_id, dir_fd=_RECORDINGS_FD)
+        else:
+            os.mkdir(RECORDINGS_DIR / session_id)
+    except FileExistsError:
+        pass
+
+
+def recording_target(session_id: str, filename: str):
+    """
+    Build the os.open() arguments for a file in the recordings directory.
+    
+    Args:
+        session_id: Session ID already validated by get_recordings_dir, or None
+        filename: Name of the recording file
+    
+    Returns:
+        (path, dir_fd) - a path relative to the cached directory fd when available,
+        otherwise an absolute path with dir_fd=None
+    """
+    relative = f"{session_id}/{filename}" if session_id else filename
+    if _RECORDINGS_FD is not None:
+        return relative, _RECORDINGS_FD
+    return str(RECORDINGS_DIR / relative), None
+
+
+# Question numbers accepted by /api/save-user-recording; the recording filenames
+# are pre-built so a request only indexes into a table
+MAX_QUESTION_NUMBER = 1000
+WEBM_FILENAMES = [f"user_answer_{i}.webm" for i in range(MAX_QUESTION_NUMBER)]
+MP4_FILENAMES = [f"user_answer_{i}.mp4" for i in range(MAX_QUESTION_NUMBER)]
+WEBM_FILENAME_SET = frozenset(WEBM_FILENAMES)
+# Question number at the end of a recording stem, e.g. "user_answer_1" -> 1
+RECORDING_QUESTION_NUMBER_RE = re.compile(r'_(\d+)$')
+
+
+def parse_question_number(value) -> int:
+    """
+    Parse the questionNumber form field.
+    
+    Args:
+        value: Raw form value
+    
+    Returns:
+        Question number in [0, MAX_QUESTION_NUMBER)
+    
+    Raises:
+        ValueError: If the value is not an integer in range
+    """
+    question_num = int(value)
+    if not 0 <= question_num < MAX_QUESTION_NUMBER:
+        raise ValueError(f"questionNumber out of range: {question_num}")
+    return question_num
+
+
+# Buffer size for the user-space fallback when copying uploads to disk
+UPLOAD_COPY_CHUNK = 1 << 20
+
+
+def _prepare_upload_copy(src_fd: int, dst_fd: int, size: int):
+    """
+    Hint the kernel about an upcoming upload copy of the given size.
+    
+    Preallocating the destination lets the filesystem reserve the extents in
+    one step instead of growing the file on every write, and the sequential
+    read-ahead hint speeds up reading the spooled upload. Both are advisory.
+    """
+    if size <= 0:
+        return
+    try:
+        if hasattr(os, 'posix_fallocate'):
+            os.posix_fallocate(dst_fd, 0, size)
+        if hasattr(os, 'posix_fadvise'):
+            os.posix_fadvise(src_fd, 0, 0, os.POSIX_FADV_SEQUENTIAL)
+    except OSError:
+        pass  # Not supported by this filesystem
+
+
+def _upload_fileno(src):
     """
-    Clear all recordings from the user_recordings directory and feedback folder.
-    Called at the start of each new interview.
+    Return the OS file descriptor of an upload stream that is already on disk, or None.
+    
+    Werkzeug spools uploads in a SpooledTemporaryFile, which only has a real file
+    once it has rolled over to disk; calling fileno() before that would force an
+    in-memory upload onto disk.
     """
+    if isinstance(src, tempfile.SpooledTemporaryFile):
+        if not getattr(src, '_rolled', False):
+            return None
+        src = src._file
     try:
-        recordings_dir = Path(__file__).parent / "user_recordings"
-        feedback_dir = Path(__file__).parent / "interview_feedback"
+        return src.fileno()
+    except (AttributeError, OSError, ValueError):
+        return None
+
+
+def save_upload(file_storage, dest_path, dir_fd: int = None) -> int:
+    """
+    Write an uploaded file to disk without going through FileStorage.save().
+    
+    Large uploads are spooled by Werkzeug to a real temporary file (a rolled-over
+    SpooledTemporaryFile); those are copied in-kernel with os.copy_file_range.
+    In-memory uploads (or platforms without copy_file_range) fall back to
+    shutil.copyfileobj with a 1 MiB buffer.
+    
+    Args:
+        file_storage: Werkzeug FileStorage from request.files
+        dest_path: Destination file path (relative to dir_fd if given)
+        dir_fd: Optional directory fd that dest_path is resolved against
+    
+    Returns:
+        Number of bytes written
+    """
+    src = file_storage.stream
+    
+    src_fd = _upload_fileno(src)
+    
+    dst_fd = os.open(dest_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, 'O_BINARY', 0), 0o644, dir_fd=dir_fd)
+    with open(dst_fd, 'wb') as dst:
+        if src_fd is not None:
+            offset = src.tell()
+            # The upload is on disk, so its size is known: preallocate whichever
+            # copy path runs below
+            _prepare_upload_copy(src_fd, dst_fd, os.fstat(src_fd).st_size - offset)
+            if hasattr(os, 'copy_file_range'):
+                written = 0
+                try:
+                    while True:
+                        copied = os.copy_file_range(src_fd, dst_fd, 1 << 30, offset + written)
+                        if copied == 0:
+                            return written
+                        written += copied
+                except OSError:
+                    # e.g. EXDEV/ENOSYS - finish the copy in user space
+                    src.seek(offset + written)
         
-        # Create directories if they don't exist
-        recordings_dir.mkdir(exist_ok=True)
-        feedback_dir.mkdir(exist_ok=True)
+        shutil.copyfileobj(src, dst, UPLOAD_COPY_CHUNK)
+        return dst.tell()
+
+
+# API clients are created lazily (and pre-warmed in the background below)
+# so importing this module stays cheap.
+_question_generator = None
+_tts_generator = None
+_tts_initialized = False
+_clients_lock = threading.Lock()
+
+
+def get_question_generator() -> InterviewQuestionGenerator:
+    """Return the shared question generator, creating it on first use."""
+    global _question_generator
+    if _question_generator is None:
+        with _clients_lock:
+            if _question_generator is None:
+                _question_generator = InterviewQuestionGenerator()
+    return _question_generator
+
+
+def get_tts_generator():
+    """Return the shared TTS generator, or None if ElevenLabs is unavailable."""
+    global _tts_generator, _tts_initialized
+    if not _tts_initialized:
+        with _clients_lock:
+            if not _tts_initialized:
+                try:
+                    from text_to_speech import TextToSpeech
+                    _tts_generator = TextToSpeech(httpx_client=HTTP)
+                except Exception as e:
+                    logger.warning(f"Warning: Could not initialize TTS generator: {e}")
+                    _tts_generator = None
+                _tts_initialized = True
+    return _tts_generator
+
+
+# Serialized question lists keyed by normalized (company, job description).
+# Identical interview setups skip the Gemini round trip entirely.
+QUESTION_CACHE_TTL = int(os.environ.get('QUESTION_CACHE_TTL', 6 * 60 * 60))
+_question_cache = TTLCache(maxsize=1024, ttl=QUESTION_CACHE_TTL)
+_question_cache_lock = threading.Lock()
+
+
+# Exact-match LLM responses are also persisted in SQLite, so they are shared
+# between server workers and survive restarts
+RESPONSE_CACHE_TTL = int(os.environ.get('RESPONSE_CACHE_TTL', 7 * 24 * 60 * 60))
+response_cache = ResponseCache(
+    os.environ.get('RESPONSE_CACHE_DB', str(Path(__file__).parent / "response_cache.sqlite3")),
+    ttl_seconds=RESPONSE_CACHE_TTL
+)
+
+
+def question_cache_key(company_name: str, job_description: str) -> str:
+    """Build the exact-match cache key for a (company, job description) pair."""
+    setup = f"{company_name.lower()}\0{job_description}".encode('utf-8')
+    return f"questions:{hashlib.blake2b(setup, digest_size=16).hexdigest()}"
+
+
+# Near-duplicate postings of the same company (same role, different boilerplate)
+# reuse cached questions.
+# Disabled automatically when sentence-transformers is not installed.
+semantic_question_cache = SemanticQuestionCache(
+    verifier=lambda cached, query: get_question_generator().is_same_role(cached, query)
+)
+
+
+def semantic_question_scope(company_name: str) -> str:
+    """
+    Scope of the semantic question cache: questions are company-specific, so
+    only setups of the same (normalized) company name may share them.
+    """
+    return " ".join(company_name.lower().split())
+
+
+def lookup_cached_questions(company_name: str, job_description: str):
+    """
+    Find cached questions for an interview setup.
+    Tiers: in-process TTL cache -> persistent SQLite cache -> semantic cache.
+    
+    Args:
+        company_name: Name of the company
+        job_description: Description of the job position
+    
+    Returns:
+        Serialized questions (orjson bytes), or None on a miss
+    """
+    cache_key = question_cache_key(company_name, job_description)
+    with _question_cache_lock:
+        questions_body = _question_cache.get(cache_key)
+    if questions_body is not None:
+        return questions_body
+    
+    questions_body = response_cache.get(cache_key)
+    if questions_body is None:
+        questions_body = semantic_question_cache.lookup(job_description, semantic_question_scope(company_name))
+    
+    if questions_body is not None:
+        with _question_cache_lock:
+            _question_cache[cache_key] = questions_body
+    return questions_body
+
+
+def store_questions(company_name: str, job_description: str, questions_body: bytes):
+    """
+    Add freshly generated questions to every cache tier.
+    
+    Args:
+        company_name: Name of the company
+        job_description: Description of the job position
+        questions_body: Serialized questions (orjson bytes)
+    """
+    cache_key = question_cache_key(company_name, job_description)
+    with _question_cache_lock:
+        _question_cache[cache_key] = questions_body
+    response_cache.set(cache_key, questions_body)
+    semantic_question_cache.add(job_description, questions_body, semantic_question_scope(company_name))
+
+
+def prewarm():
+    """Create API clients and load the embedding model off the request path."""
+    try:
+        get_question_generator()
+    except Exception as e:
+        logger.warning(f"Warning: Could not initialize question generator: {e}")
+    if ENABLE_TTS:
+        get_tts_generator()
+    try:
+        semantic_question_cache.warm_up()
+    except Exception as e:
+        logger.warning(f"Warning: Could not load semantic cache model: {e}")
+
+
+def preconnect():
+    """
+    Open a keep-alive connection to ElevenLabs ahead of the first request.
+    Must run in the serving process (not a pre-fork master), since pooled
+    sockets must not be shared between forked workers.
+    """
+    try:
+        HTTP.head("https://api.elevenlabs.io/")
+    except httpx.HTTPError as e:
+        logger.warning(f"Warning: Could not preconnect to ElevenLabs: {e}")
+
+
+# Joined by gunicorn.conf.py so preloaded workers fork with everything loaded
+prewarm_thread = threading.Thread(target=prewarm, name="prewarm", daemon=True)
+prewarm_thread.start()
+
+
+def delete_files_in(directory: Path) -> int:
+    """
+    Delete the regular files directly inside a directory (subdirectories are kept).
+    
+    os.scandir reports the file type from the directory listing itself, so
+    unlike Path.iterdir() + is_file() there is no extra stat() per entry.
+    
+    Args:
+        directory: Directory to empty
+    
+    Returns:
+        Number of files deleted
+    """
+    deleted = 0
+    with os.scandir(directory) as entries:
+        for entry in entries:
+            if entry.is_file(follow_symlinks=False):
+                os.unlink(entry.path)
+                deleted += 1
+    return deleted
+
+
+@api.route('/api/clear-recordings', methods=['POST'])
+def clear_recordings():
+    """
+    Clear all recordings from the user_recordings directory (and their direct
+    S3 uploads) and the feedback folder. Called at the start of each new interview.
+    Only the top-level (session-less) files are deleted; per-session
+    subdirectories are removed by reset-session.
+    """
+    try:
+        recordings_dir = RECORDINGS_DIR
+        feedback_dir = FEEDBACK_DIR
         
         # Delete all files in the recordings directory
-        recordings_deleted = 0
-        for file_path in recordings_dir.iterdir():
-            if file_path.is_file():
-                file_path.unlink()
-                recordings_deleted += 1
+        recordings_deleted = delete_files_in(recordings_dir)
         
         # Delete all files in the feedback directory
-        feedback_deleted = 0
-        for file_path in feedback_dir.iterdir():
-            if file_path.is_file():
-                file_path.unlink()
-                feedback_deleted += 1
+        feedback_deleted = delete_files_in(feedback_dir)
         
-        print(f"✓ Cleared {recordings_deleted} file(s) from user_recordings directory")
-        print(f"✓ Cleared {feedback_deleted} file(s) from interview_feedback directory")
+        # Recordings uploaded directly to S3 would otherwise be fetched again
+        uploads_deleted = delete_direct_uploads(None)
         
-        return jsonify({
+        logger.info(f"✓ Cleared {recordings_deleted} file(s) from user_recordings directory")
+        if uploads_deleted:
+            logger.info(f"✓ Deleted {uploads_deleted} direct upload(s) from S3")
+        logger.info(f"✓ Cleared {feedback_deleted} file(s) from interview_feedback directory")
+        
+        return _json({
             'success': True,
             'message': f'Cleared {recordings_deleted} recording(s) and {feedback_deleted} feedback file(s)',
             'recordingsDeleted': recordings_deleted,
             'feedbackDeleted': feedback_deleted
-        }), 200
+        }, 200)
         
     except Exception as e:
-        print(f"Error clearing recordings: {e}")
-        import traceback
-        traceback.print_exc()
-        return jsonify({
+        logger.exception(f"Error clearing recordings: {e}")
+        return _json({
             'success': False,
             'error': f'Error clearing recordings: {str(e)}'
-        }), 500
+        }, 500)
+
+
+@api.route('/api/reset-session', methods=['POST'])
+def reset_session():
+    """
+    Delete the recordings and feedback of a single interview session.
+    Only user_recordings/<sessionId>/, interview_feedback/<sessionId>/ and the
+    session's direct S3 uploads are removed, so other sessions are left untouched.
+    """
+    try:
+        data = request.get_json() or {}
+        session_id = str(data.get('sessionId', '')).strip()
+        
+        if not SESSION_ID_RE.match(session_id):
+            return _json({
+                'success': False,
+                'error': 'A valid sessionId is required'
+            }, 400)
+        
+        session_dir = get_recordings_dir(session_id)
+        shutil.rmtree(session_dir, ignore_errors=True)
+        os.makedirs(session_dir, exist_ok=True)
+        shutil.rmtree(get_feedback_dir(session_id), ignore_errors=True)
+        delete_direct_uploads(session_id)
+        
+        logger.info(f"✓ Reset recordings for session {session_id}")
+        
+        return _json({
+            'success': True,
+            'message': f'Session {session_id} reset',
+            'sessionId': session_id
+        }, 200)
+        
+    except Exception as e:
+        logger.exception(f"Error resetting session: {e}")
+        return _json({
+            'success': False,
+            'error': f'Error resetting session: {str(e)}'
+        }, 500)
+
+
+def _format_questions(questions: dict) -> list:
+    """
+    Number the generated questions in the order they are asked.
+    
+    Args:
+        questions: Dict with 'introduction', 'regular' and 'situational' lists
+    
+    Returns:
+        List of {'number', 'type', 'text'} dicts
+    """
+    ordered = [
+        *(("Introduction", text) for text in questions.get("introduction", [])[:1]),
+        *(("Regular", text) for text in questions.get("regular", [])),
+        *(("Situational", text) for text in questions.get("situational", [])),
+    ]
+    return [
+        {"number": number, "type": question_type, "text": text}
+        for number, (question_type, text) in enumerate(ordered, start=1)
+    ]
 
 
-@app.route('/api/start-interview', methods=['POST'])
+@api.route('/api/start-interview', methods=['POST'])
 def start_interview():
     """
     Generate interview questions based on company name and job description.
@@ -101,67 +567,245 @@ def start_interview():
         data = request.get_json()
         
         if not data:
-            return jsonify({'error': 'No data provided'}), 400
+            return _json({'error': 'No data provided'}, 400)
         
         company_name = data.get('companyName', '').strip()
         job_description = data.get('jobDescription', '').strip()
         
         if not company_name:
-            return jsonify({'error': 'Company name is required'}), 400
+            return _json({'error': 'Company name is required'}, 400)
         
         if not job_description:
-            return jsonify({'error': 'Job description is required'}), 400
+            return _json({'error': 'Job description is required'}, 400)
         
-        # Generate questions
-        questions = question_generator.generate_questions(company_name, job_description)
+        questions_body = lookup_cached_questions(company_name, job_description)
         
-        # Format questions for response
-        all_questions = []
-        question_num = 1
-        
-        # Add introduction question
-        if questions.get("introduction"):
-            all_questions.append({
-                "number": question_num,
-                "type": "Introduction",
-                "text": questions["introduction"][0]
-            })
-            question_num += 1
-        
-        # Add regular questions
-        for regular_q in questions.get("regular", []):
-            all_questions.append({
-                "number": question_num,
-                "type": "Regular",
-                "text": regular_q
-            })
-            question_num += 1
-        
-        # Add situational questions
-        for situational_q in questions.get("situational", []):
-            all_questions.append({
-                "number": question_num,
-                "type": "Situational",
-                "text": situational_q
-            })
-            question_num += 1
-        
-        return jsonify({
+        if questions_body is None:
+            # Generate questions
+            questions = get_question_generator().generate_questions(company_name, job_description)
+            
+            all_questions = _format_questions(questions)
+            if not all_questions:
+                # Unparseable or empty generation: report it instead of caching it
+                logger.error("Question generation returned no questions")
+                return _json({'error': 'Failed to generate questions. Please try again.'}, 500)
+            
+            # Serialize once; cache hits embed these bytes without re-encoding
+            questions_body = orjson.dumps(all_questions)
+            store_questions(company_name, job_description, questions_body)
+        
+        return _json({
             'success': True,
             'companyName': company_name,
-            'questions': all_questions
-        }), 200
+            'questions': orjson.Fragment(questions_body)
+        }, 200)
         
     except ValueError as e:
-        return jsonify({'error': str(e)}), 400
+        return _json({'error': str(e)}, 400)
     except Exception as e:
-        print(f"Error generating questions: {e}")
-        import traceback
-        traceback.print_exc()
-        return jsonify({'error': 'Failed to generate questions. Please try again.'}), 500
+        logger.exception(f"Error generating questions: {e}")
+        return _json({'error': 'Failed to generate questions. Please try again.'}, 500)
+
+
+def _sse(payload, event=None) -> str:
+    """Format one Server-Sent Event."""
+    prefix = f"event: {event}\n" if event else ""
+    return f"{prefix}data: {orjson.dumps(payload).decode()}\n\n"
+
+
+@api.route('/api/start-interview-stream', methods=['POST'])
+def start_interview_stream():
+    """
+    Stream interview questions as Server-Sent Events.
+    
+    Each question is sent as soon as Gemini has produced it, so the frontend can
+    render (and start TTS for) the first question while the rest are generated.
+    Cached setups are streamed immediately. The stream ends with a "done" event.
+    """
+    data = request.get_json(silent=True)
+    
+    if not data:
+        return _json({'error': 'No data provided'}, 400)
+    
+    company_name = data.get('companyName', '').strip()
+    job_description = data.get('jobDescription', '').strip()
+    
+    if not company_name:
+        return _json({'error': 'Company name is required'}, 400)
+    
+    if not job_description:
+        return _json({'error': 'Job description is required'}, 400)
+    
+    def generate():
+        questions_body = lookup_cached_questions(company_name, job_description)
+        
+        if questions_body is not None:
+            questions = orjson.loads(questions_body)
+            for question in questions:
+                yield _sse(question)
+            yield _sse({'count': len(questions)}, event='done')
+            return
+        
+        all_questions = []
+        try:
+            for category, text in get_question_generator().stream_questions(company_name, job_description):
+                # Only one introduction question is asked
+                if category == QUESTION_CATEGORIES[0] and all_questions:
+                    continue
+                question = {
+                    "number": len(all_questions) + 1,
+                    "type": category.capitalize(),
+                    "text": text
+                }
+                all_questions.append(question)
+                yield _sse(question)
+        except Exception:
+            logger.exception("Error streaming questions")
+            yield _sse({'error': 'Failed to generate questions. Please try again.'}, event='error')
+            return
+        
+        if not all_questions:
+            # An empty stream must not be cached, or every retry would get nothing
+            logger.error("Question stream ended without any questions")
+            yield _sse({'error': 'Failed to generate questions. Please try again.'}, event='error')
+            return
+        
+        store_questions(company_name, job_description, orjson.dumps(all_questions))
+        yield _sse({'count': len(all_questions)}, event='done')
+    
+    return Response(
+        stream_with_context(generate()),
+        mimetype='text/event-stream',
+        headers={
+            'Cache-Control': 'no-cache',
+            'X-Accel-Buffering': 'no'  # Let nginx pass events through unbuffered
+        }
+    )
+
+
+# No banner or periodic progress lines: ffmpeg's log is only read when it fails
+FFMPEG_QUIET_ARGS = ('-hide_banner', '-nostats')
 
-@app.route('/api/save-user-recording', methods=['POST'])
-def save_user_recording():
+
+def _read_ffmpeg_log(log) -> str:
+    """Read back an ffmpeg stderr log written to a temporary file."""
+    log.seek(0)
+    return log.read().decode(errors='replace')
+
+
+async def run_ffmpeg(*args: str):
+    """
+    Run ffmpeg as an asyncio subprocess.
+    
+    Async views await the child process instead of blocking in subprocess.run(),
+    so several ffmpeg jobs can run concurrently within one request. The log
+    goes to a temporary file rather than a pipe and is only read on failure.
+    
+    Args:
+        *args: ffmpeg arguments (without the executable)
+    
+    Raises:
+        subprocess.CalledProcessError: If ffmpeg exits with a non-zero status
+        FileNotFoundError: If ffmpeg is not installed
+    """
+    cmd = ['ffmpeg', *FFMPEG_QUIET_ARGS, *args]
+    with tempfile.TemporaryFile() as log:
+        proc = await asyncio.create_subprocess_exec(
+            *cmd,
+            stdout=asyncio.subprocess.DEVNULL,
+            stderr=log
+        )
+        await proc.wait()
+        if proc.returncode != 0:
+            raise subprocess.CalledProcessError(proc.returncode, cmd, stderr=_read_ffmpeg_log(log))
+
+
+# Encoder settings for browser recordings converted to mp4. Recordings are short
+# and only played back locally / analyzed, so encode speed beats file size.
+MP4_VIDEO_ARGS = (
+    '-c:v', 'libx264',
+    '-preset', 'ultrafast',
+    '-tune', 'zerolatency',
+    '-crf', '28',
+    '-threads', '0',
+)
+# Copy the recorded (Opus) audio as-is; re-encode to AAC if the container rejects it
+MP4_AUDIO_COPY_ARGS = ('-c:a', 'copy')
+MP4_AUDIO_AAC_ARGS = ('-c:a', 'aac')
+
+
+async def transcode_upload_to_mp4(file_storage, mp4_path: Path, audio_args: tuple = MP4_AUDIO_COPY_ARGS):
+    """
+    Transcode an uploaded webm recording to mp4 by streaming it into ffmpeg's stdin.
+    
+    The upload is never written to disk as webm, which saves a full write and
+    read of the recording before encoding can start.
+    
+    Args:
+        file_storage: Werkzeug FileStorage from request.files
+        mp4_path: Destination mp4 path (overwritten if it exists)
+        audio_args: ffmpeg audio codec arguments
+    
+    Raises:
+        subprocess.CalledProcessError: If ffmpeg fails
+        FileNotFoundError: If ffmpeg is not installed
+    """
+    cmd = ['ffmpeg', *FFMPEG_QUIET_ARGS, '-i', 'pipe:0', *MP4_VIDEO_ARGS, *audio_args, '-y', str(mp4_path)]
+    with tempfile.TemporaryFile() as log:
+        proc = await asyncio.create_subprocess_exec(
+            *cmd,
+            stdin=asyncio.subprocess.PIPE,
+            stdout=asyncio.subprocess.DEVNULL,
+            stderr=log
+        )
+        
+        src = file_storage.stream
+        try:
+            while chunk := src.read(UPLOAD_COPY_CHUNK):
+                proc.stdin.write(chunk)
+                await proc.stdin.drain()
+        except (BrokenPipeError, ConnectionResetError):
+            pass  # ffmpeg exited early; its status is reported below
+        finally:
+            proc.stdin.close()
+        
+        await proc.wait()
+        if proc.returncode != 0:
+            raise subprocess.CalledProcessError(proc.returncode, cmd, stderr=_read_ffmpeg_log(log))
+
+
+async def convert_recording_to_mp4(webm_path: Path, mp4_path: Path):
+    """
+    Convert a browser webm recording to mp4 using ffmpeg.
+    
+    Args:
+        webm_path: Path to the webm recording
+        mp4_path: Destination mp4 path (overwritten if it exists)
+    
+    Raises:
+        subprocess.CalledProcessError: If ffmpeg fails
+        FileNotFoundError: If ffmpeg is not installed
+    """
+    try:
+        await run_ffmpeg(
+            '-i', str(webm_path),
+            *MP4_VIDEO_ARGS,
+            *MP4_AUDIO_COPY_ARGS,
+            '-y',  # Overwrite output file
+            str(mp4_path)
+        )
+    except subprocess.CalledProcessError:
+        await run_ffmpeg(
+            '-i', str(webm_path),
+            *MP4_VIDEO_ARGS,
+            *MP4_AUDIO_AAC_ARGS,
+            '-y',
+            str(mp4_path)
+        )
+
+
+@api.route('/api/save-user-recording', methods=['POST'])
+async def save_user_recording():
     """
     Endpoint to save user's audio/video recording.
     Saves recordings to the user_recordings folder and converts webm to mp4.
@@ -169,54 +813,58 @@ def save_user_recording():
     try:
         # Check if audio file is in the request
         if 'audio' not in request.files:
-            return jsonify({
+            return _json({
                 'success': False,
                 'error': 'No audio file provided'
-            }), 400
+            }, 400)
         
         audio_file = request.files['audio']
         question_num = request.form.get('questionNumber', '1')
+        try:
+            question_index = parse_question_number(question_num)
+        except (TypeError, ValueError):
+            return _json({
+                'success': False,
+                'error': 'Invalid questionNumber'
+            }, 400)
         
         # Validate the file
         if audio_file.filename == '':
-            return jsonify({
+            return _json({
                 'success': False,
                 'error': 'No file selected'
-            }), 400
+            }, 400)
         
-        # Create the user_recordings directory if it doesn't exist
-        recordings_dir = Path(__file__).parent / "user_recordings"
-        recordings_dir.mkdir(exist_ok=True)
+        session_id = request.form.get('sessionId')
+        try:
+            recordings_dir = get_recordings_dir(session_id)
+        except ValueError as e:
+            return _json({
+                'success': False,
+                'error': str(e)
+            }, 400)
+        # Create the session directory if it doesn't exist
+        ensure_session_dir(session_id)
         
-        # Save as webm first (browser format)
-        webm_filename = f"user_answer_{question_num}.webm"
+        webm_filename = WEBM_FILENAMES[question_index]
         webm_path = recordings_dir / webm_filename
-        audio_file.save(webm_path)
-        
-        # Convert webm to mp4 using ffmpeg
-        mp4_filename = f"user_answer_{question_num}.mp4"
+        mp4_filename = MP4_FILENAMES[question_index]
         mp4_path = recordings_dir / mp4_filename
         
         try:
-            # Use ffmpeg to convert webm to mp4
-            subprocess.run([
-                'ffmpeg',
-                '-i', str(webm_path),
-                '-c:v', 'libx264',
-                '-c:a', 'aac',
-                '-preset', 'medium',
-                '-y',  # Overwrite output file
-                str(mp4_path)
-            ], check=True, capture_output=True, text=True)
-            
-            # Delete the webm file after successful conversion
-            webm_path.unlink()
+            # Pipe the upload straight into ffmpeg; no intermediate webm on disk
+            try:
+                await transcode_upload_to_mp4(audio_file, mp4_path)
+            except subprocess.CalledProcessError:
+                # Audio codec could not be copied into mp4 - retry with AAC
+                audio_file.stream.seek(0)
+                await transcode_upload_to_mp4(audio_file, mp4_path, audio_args=MP4_AUDIO_AAC_ARGS)
             
-            print(f"✓ Recording converted and saved: {mp4_filename}")
-            print(f"  Path: {mp4_path}")
-            print(f"  Size: {mp4_path.stat().st_size} bytes")
+            logger.info(f"✓ Recording converted and saved: {mp4_filename}")
+            logger.info(f"  Path: {mp4_path}")
+            logger.info(f"  Size: {mp4_path.stat().st_size} bytes")
             
-            return jsonify({
+            return _json({
                 'success': True,
                 'data': {
                     'filename': mp4_filename,
@@ -225,14 +873,17 @@ def save_user_recording():
                     'size': mp4_path.stat().st_size
                 },
                 'message': 'Recording saved and converted to MP4 successfully'
-            }), 200
+            }, 200)
             
         except subprocess.CalledProcessError as e:
-            # If ffmpeg conversion fails, keep the webm file
-            print(f"Warning: FFmpeg conversion failed: {e.stderr}")
-            print(f"Keeping webm file: {webm_filename}")
+            # If ffmpeg conversion fails, keep the upload as a webm file
+            logger.warning(f"Warning: FFmpeg conversion failed: {e.stderr}")
+            logger.warning(f"Keeping webm file: {webm_filename}")
+            mp4_path.unlink(missing_ok=True)
+            audio_file.stream.seek(0)
+            save_upload(audio_file, *recording_target(session_id, webm_filename))
             
-            return jsonify({
+            return _json({
                 'success': True,
                 'data': {
                     'filename': webm_filename,
@@ -242,13 +893,15 @@ def save_user_recording():
                 },
                 'message': 'Recording saved as webm (mp4 conversion failed)',
                 'warning': 'FFmpeg not available or conversion failed'
-            }), 200
+            }, 200)
             
         except FileNotFoundError:
             # FFmpeg not found, keep webm file
-            print(f"Warning: FFmpeg not found. Keeping webm file: {webm_filename}")
+            logger.warning(f"Warning: FFmpeg not found. Keeping webm file: {webm_filename}")
+            audio_file.stream.seek(0)
+            save_upload(audio_file, *recording_target(session_id, webm_filename))
             
-            return jsonify({
+            return _json({
                 'success': True,
                 'data': {
                     'filename': webm_filename,
@@ -258,126 +911,403 @@ def save_user_recording():
                 },
                 'message': 'Recording saved as webm (FFmpeg not available)',
                 'warning': 'FFmpeg not found in system PATH'
-            }), 200
+            }, 200)
         
     except Exception as e:
-        print(f"Error saving user recording: {e}")
-        import traceback
-        traceback.print_exc()
-        return jsonify({
+        logger.exception(f"Error saving user recording: {e}")
+        return _json({
             'success': False,
             'error': f'Error saving recording: {str(e)}'
-        }), 500
+        }, 500)
 
 
-@app.route('/api/text-to-speech', methods=['POST'])
-def text_to_speech():
+# With RECORDINGS_BUCKET set, the browser uploads recordings straight to S3 using
+# presigned PUT URLs and the server only fetches them when analysis starts
+RECORDINGS_BUCKET = os.environ.get('RECORDINGS_BUCKET', '')
+RECORDING_UPLOAD_URL_EXPIRES = 300
+_s3_client = None
+
+
+def get_s3_client():
+    """Return the shared boto3 S3 client, creating it on first use."""
+    global _s3_client
+    if _s3_client is None:
+        with _clients_lock:
+            if _s3_client is None:
+                import boto3  # Optional dependency, only needed for direct uploads
+                _s3_client = boto3.client('s3')
+    return _s3_client
+
+
+def recording_object_key(session_id: str, filename: str) -> str:
+    """S3 key of a recording uploaded directly by the browser."""
+    return f"answers/{session_id}/{filename}" if session_id else f"answers/{filename}"
+
+
+def list_direct_uploads(session_id: str) -> list:
     """
-    Convert text to speech using ElevenLabs TTS.
-    Returns the audio file path or uses browser TTS if ElevenLabs is unavailable.
+    List the recordings of a session uploaded to S3.
+    
+    Args:
+        session_id: Session ID already validated by get_recordings_dir, or None
+    
+    Returns:
+        (object key, filename) pairs of the recordings found
     """
-    try:
-        data = request.get_json()
-        
-        if not data:
-            return jsonify({'error': 'No data provided'}), 400
-        
-        text = data.get('text', '').strip()
-        
+    prefix = recording_object_key(session_id, "")
+    paginator = get_s3_client().get_paginator('list_objects_v2')
+    uploads = []
+    for page in paginator.paginate(Bucket=RECORDINGS_BUCKET, Prefix=prefix, Delimiter='/'):
+        for obj in page.get('Contents', []):
+            filename = obj['Key'][len(prefix):]
+            if filename in WEBM_FILENAME_SET:
+                uploads.append((obj['Key'], filename))
+    return uploads
+
+
+def delete_direct_uploads(session_id: str) -> int:
+    """
+    Delete the recordings of a session uploaded to S3, so answers left from a
+    previous interview are not fetched and analyzed as part of the next one.
+    
+    Args:
+        session_id: Session ID already validated by get_recordings_dir, or None
+    
+    Returns:
+        Number of objects deleted (0 if direct uploads are not configured)
+    """
+    if not RECORDINGS_BUCKET:
+        return 0
+    keys = [key for key, _ in list_direct_uploads(session_id)]
+    if keys:
+        # At most MAX_QUESTION_NUMBER (1000) keys, the limit of one delete_objects call
+        get_s3_client().delete_objects(
+            Bucket=RECORDINGS_BUCKET,
+            Delete={'Objects': [{'Key': key} for key in keys], 'Quiet': True}
+        )
+    return len(keys)
+
+
+async def fetch_direct_uploads(session_id: str, recordings_dir: Path) -> int:
+    """
+    Download recordings uploaded to S3 and convert them to mp4 for analysis.
+    Recordings that already have a local mp4 are skipped.
+    
+    Args:
+        session_id: Session ID already validated by get_recordings_dir, or None
+        recordings_dir: Local recordings directory of the session
+    
+    Returns:
+        Number of recordings fetched
+    """
+    ensure_session_dir(session_id)
+    s3 = await asyncio.to_thread(get_s3_client)
+    fetched = 0
+    
+    # boto3 is blocking, so its calls run in worker threads
+    for key, filename in await asyncio.to_thread(list_direct_uploads, session_id):
+        webm_path = recordings_dir / filename
+        mp4_path = webm_path.with_suffix('.mp4')
+        if mp4_path.exists():
+            continue
+        
+        await asyncio.to_thread(s3.download_file, RECORDINGS_BUCKET, key, str(webm_path))
+        try:
+            await convert_recording_to_mp4(webm_path, mp4_path)
+            webm_path.unlink()
+        except (subprocess.CalledProcessError, FileNotFoundError) as e:
+            logger.warning(f"Warning: Could not convert {filename} to mp4: {e}")
+            continue
+        fetched += 1
+    
+    return fetched
+
+
+@api.route('/api/recording-upload-url', methods=['POST'])
+def recording_upload_url():
+    """
+    Issue a presigned S3 PUT URL so the browser can upload a recording directly.
+    Returns 404 when direct uploads are not configured; clients then fall back
+    to /api/save-user-recording.
+    """
+    if not RECORDINGS_BUCKET:
+        return _json({
+            'success': False,
+            'error': 'Direct uploads are not configured'
+        }, 404)
+    
+    try:
+        data = request.get_json(silent=True) or {}
+        try:
+            question_index = parse_question_number(data.get('questionNumber', 1))
+            session_id = data.get('sessionId')
+            get_recordings_dir(session_id)
+        except (TypeError, ValueError) as e:
+            return _json({
+                'success': False,
+                'error': str(e)
+            }, 400)
+        
+        key = recording_object_key(session_id, WEBM_FILENAMES[question_index])
+        url = get_s3_client().generate_presigned_url(
+            'put_object',
+            Params={'Bucket': RECORDINGS_BUCKET, 'Key': key, 'ContentType': 'video/webm'},
+            ExpiresIn=RECORDING_UPLOAD_URL_EXPIRES
+        )
+        
+        return _json({
+            'success': True,
+            'url': url,
+            'key': key,
+            'expiresIn': RECORDING_UPLOAD_URL_EXPIRES
+        }, 200)
+        
+    except Exception as e:
+        logger.exception(f"Error creating upload URL: {e}")
+        return _json({
+            'success': False,
+            'error': 'Failed to create upload URL'
+        }, 500)
+
+
+# When running behind nginx (see nginx.conf), set e.g. AUDIO_ACCEL_REDIRECT_PREFIX=/internal-audio/
+# so audio bytes are served by the proxy instead of streaming through Python
+AUDIO_ACCEL_REDIRECT_PREFIX = os.environ.get('AUDIO_ACCEL_REDIRECT_PREFIX', '')
+
+
+# Bytes of BLAKE2b digest in content-addressed TTS filenames
+TTS_DIGEST_SIZE = 12
+
+
+@functools.lru_cache(maxsize=256)
+def tts_audio_filename(text: str) -> str:
+    """
+    Content-addressed filename for the TTS audio of a text.
+    Unlike the salted built-in hash(), BLAKE2b is stable across restarts,
+    so previously generated audio is found again; 96 bits keep collisions
+    between distinct texts out of reach.
+    """
+    digest = hashlib.blake2b(text.strip().encode('utf-8'), digest_size=TTS_DIGEST_SIZE).hexdigest()
+    return f"question_tts_{digest}.mp3"
+
+
+# Audio files recently confirmed on disk; hot replays skip the stat()/utime() calls.
+# Entries expire well before any mtime-based cleanup could remove the file.
+_tts_known_files = TTLCache(maxsize=256, ttl=600)
+_tts_known_files_lock = threading.Lock()
+
+# TTS filenames embed the content hash, which doubles as a strong ETag. Only the
+# exact digest length matches: legacy names from the old hash % 10000 scheme
+# (e.g. question_tts_1053.mp3) are not content-addressed
+TTS_AUDIO_FILENAME_RE = re.compile(r'^question_tts_([0-9a-f]{24})\.mp3$')  # 2 hex digits per digest byte
+
+# Audio for a given hash never changes, so content-addressed files are immutable;
+# anything else (named outside tts_audio_filename) may be replaced, so cache it for a day
+AUDIO_IMMUTABLE_MAX_AGE = 31536000
+AUDIO_CACHE_MAX_AGE = 86400
+
+
+def _cache_audio_response(response: Response, etag: str, immutable: bool = False) -> Response:
+    """Attach the ETag and public caching headers to an audio response."""
+    response.set_etag(etag)
+    response.cache_control.public = True
+    if immutable:
+        response.cache_control.max_age = AUDIO_IMMUTABLE_MAX_AGE
+        response.cache_control.immutable = True
+    else:
+        response.cache_control.max_age = AUDIO_CACHE_MAX_AGE
+    return response
+
+
+@tts_api.route('/api/text-to-speech', methods=['POST'])
+def text_to_speech():
+    """
+    Convert text to speech using ElevenLabs TTS.
+    Returns the audio file path or uses browser TTS if ElevenLabs is unavailable.
+    """
+    try:
+        data = request.get_json()
+        
+        if not data:
+            return _json({'error': 'No data provided'}, 400)
+        
+        text = data.get('text', '').strip()
+        
         if not text:
-            return jsonify({'error': 'Text is required'}), 400
+            return _json({'error': 'Text is required'}, 400)
         
         # If TTS generator is available, use it
+        tts_generator = get_tts_generator()
         if tts_generator:
             try:
-                # Generate speech
-                audio_path = tts_generator.generate_speech(
-                    text=text,
-                    output_filename=f"question_tts_{abs(hash(text)) % 10000}.mp3"
-                )
+                audio_filename = tts_audio_filename(text)
+                audio_url = f'/api/audio/{audio_filename}'
+                
+                with _tts_known_files_lock:
+                    cached = audio_filename in _tts_known_files
+                
+                if not cached:
+                    audio_path = Path(tts_generator.output_dir) / audio_filename
+                    if audio_path.exists():
+                        # Already synthesized; touch it so mtime-based cleanup keeps hot files
+                        os.utime(audio_path)
+                        cached = True
+                    else:
+                        # Generate speech
+                        tts_generator.generate_speech(
+                            text=text,
+                            output_filename=audio_filename
+                        )
+                    with _tts_known_files_lock:
+                        _tts_known_files[audio_filename] = True
                 
                 # Return the audio file URL that can be accessed by the frontend
-                audio_filename = Path(audio_path).name
-                return jsonify({
+                return _json({
                     'success': True,
-                    'audioUrl': f'/api/audio/{audio_filename}',
-                    'method': 'elevenlabs'
-                }), 200
+                    'audioUrl': audio_url,
+                    'method': 'cached' if cached else 'elevenlabs'
+                }, 200)
             except Exception as e:
-                print(f"Error generating TTS with ElevenLabs: {e}")
+                logger.error(f"Error generating TTS with ElevenLabs: {e}")
                 # Fall through to browser TTS recommendation
         
         # If ElevenLabs is not available, suggest using browser TTS
-        return jsonify({
+        return _json({
             'success': True,
             'text': text,
             'method': 'browser',
             'message': 'Use browser SpeechSynthesis API'
-        }), 200
+        }, 200)
         
     except Exception as e:
-        print(f"Error in text-to-speech endpoint: {e}")
-        import traceback
-        traceback.print_exc()
-        return jsonify({'error': 'Failed to generate speech'}), 500
+        logger.exception(f"Error in text-to-speech endpoint: {e}")
+        return _json({'error': 'Failed to generate speech'}, 500)
 
 
-@app.route('/api/audio/<filename>', methods=['GET'])
+@tts_api.route('/api/audio/<filename>', methods=['GET'])
 def serve_audio(filename):
     """
     Serve audio files generated by TTS.
     """
     try:
         # Get the output directory from TTS generator
+        tts_generator = get_tts_generator()
         if tts_generator:
             audio_dir = Path(tts_generator.output_dir)
         else:
             # Fallback to default output directory
             audio_dir = Path("output")
         
-        audio_path = audio_dir / filename
+        audio_path = str(audio_dir / filename)
         
-        if audio_path.exists():
-            return send_file(str(audio_path), mimetype='audio/mpeg')
-        else:
-            return jsonify({'error': 'Audio file not found'}), 404
+        try:
+            stat = os.stat(audio_path)
+        except FileNotFoundError:
+            return _json({'error': 'Audio file not found'}, 404)
+        
+        match = TTS_AUDIO_FILENAME_RE.match(filename)
+        immutable = match is not None
+        etag = match.group(1) if match else f"{stat.st_mtime_ns:x}-{stat.st_size:x}"
+        
+        # The client already has this exact audio - skip the transfer entirely
+        if request.if_none_match.contains(etag):
+            return _cache_audio_response(Response(status=304), etag, immutable)
+        
+        if AUDIO_ACCEL_REDIRECT_PREFIX:
+            # Let the reverse proxy sendfile() the MP3 straight from disk
+            return _cache_audio_response(Response(headers={
+                'X-Accel-Redirect': f'{AUDIO_ACCEL_REDIRECT_PREFIX}{filename}',
+                'Content-Type': 'audio/mpeg'
+            }), etag, immutable)
+        
+        # send_file sets Content-Length and handles Range requests; the file
+        # wrapper lets gunicorn sendfile() the body without copying it through Python
+        return _cache_audio_response(send_file(audio_path, mimetype='audio/mpeg', etag=False), etag, immutable)
     except Exception as e:
-        print(f"Error serving audio file: {e}")
-        return jsonify({'error': 'Failed to serve audio file'}), 500
+        logger.error(f"Error serving audio file: {e}")
+        return _json({'error': 'Failed to serve audio file'}, 500)
+
+
+# WAV format handed to the speech confidence analysis. Speech recognition
+# works on 16 kHz mono anyway, so anything richer is just bytes to write and read.
+EXTRACTED_AUDIO_RATE = 16000
+EXTRACTED_AUDIO_LAYOUT = "mono"
+EXTRACTED_AUDIO_CHANNELS = 1
+
+# The WAV only lives for the duration of one analysis, so keep it in RAM
+# (tmpfs) when available instead of round-tripping it through the disk
+EXTRACTED_AUDIO_DIR = os.environ.get('EXTRACTED_AUDIO_DIR') or (
+    '/dev/shm' if os.access('/dev/shm', os.W_OK) else tempfile.gettempdir()
+)
+
+
+def extracted_audio_path(video_path: Path) -> Path:
+    """
+    Reserve a unique temporary WAV path for a video's audio track.
+    Recording names repeat across sessions, so the name gets a random suffix.
+    
+    Args:
+        video_path: Path to MP4 video file
+    
+    Returns:
+        Path of a new, empty file in EXTRACTED_AUDIO_DIR
+    """
+    fd, path = tempfile.mkstemp(suffix=".wav", prefix=f"{video_path.stem}_", dir=EXTRACTED_AUDIO_DIR)
+    os.close(fd)
+    return Path(path)
 
 
-def extract_audio_from_mp4(video_path: Path) -> Path:
+def _extract_audio_pyav(video_path: Path, audio_path: Path):
     """
-    Extract audio from MP4 file and save as WAV using ffmpeg.
+    Decode the audio track with PyAV (libavcodec in-process) and write it as 16-bit PCM WAV.
     
     Args:
         video_path: Path to MP4 video file
+        audio_path: Destination WAV path
+    """
+    with av.open(str(video_path)) as container, av.open(str(audio_path), 'w', format='wav') as out:
+        stream = out.add_stream('pcm_s16le', rate=EXTRACTED_AUDIO_RATE, layout=EXTRACTED_AUDIO_LAYOUT)
+        resampler = av.AudioResampler(format='s16', layout=EXTRACTED_AUDIO_LAYOUT, rate=EXTRACTED_AUDIO_RATE)
+        
+        for frame in container.decode(audio=0):
+            for resampled in resampler.resample(frame):
+                out.mux(stream.encode(resampled))
+        
+        # Flush the resampler and the encoder
+        for resampled in resampler.resample(None):
+            out.mux(stream.encode(resampled))
+        out.mux(stream.encode(None))
+
+
+async def extract_audio_from_mp4(video_path: Path, audio_path: Path) -> Path:
+    """
+    Extract audio from MP4 file and save as WAV.
+    Uses PyAV in a worker thread when installed (no ffmpeg process startup per
+    file), otherwise the ffmpeg command line.
+    
+    Args:
+        video_path: Path to MP4 video file
+        audio_path: Destination WAV path (overwritten)
     
     Returns:
         Path to extracted WAV audio file
     """
-    audio_path = video_path.with_suffix(".wav")
-    
-    # Use ffmpeg command line to extract audio
-    cmd = [
-        "ffmpeg",
-        "-i", str(video_path),
-        "-vn",  # No video
-        "-acodec", "pcm_s16le",  # PCM 16-bit audio codec
-        "-ar", "44100",  # Sample rate
-        "-ac", "2",  # Stereo channels
-        "-y",  # Overwrite output file if it exists
-        str(audio_path)
-    ]
+    if av is not None:
+        try:
+            await asyncio.to_thread(_extract_audio_pyav, video_path, audio_path)
+            return audio_path
+        except av.error.FFmpegError as e:
+            raise Exception(f"FFmpeg extraction failed: {e}")
     
     try:
-        # Run ffmpeg, suppress output
-        subprocess.run(
-            cmd,
-            stdout=subprocess.PIPE,
-            stderr=subprocess.PIPE,
-            text=True,
-            check=True
+        await run_ffmpeg(
+            "-i", str(video_path),
+            "-vn",  # No video
+            "-acodec", "pcm_s16le",  # PCM 16-bit audio codec
+            "-ar", str(EXTRACTED_AUDIO_RATE),  # Sample rate
+            "-ac", str(EXTRACTED_AUDIO_CHANNELS),  # Mono
+            "-y",  # Overwrite output file if it exists
+            str(audio_path)
         )
         return audio_path
     except subprocess.CalledProcessError as e:
@@ -386,405 +1316,756 @@ def extract_audio_from_mp4(video_path: Path) -> Path:
         raise Exception("FFmpeg not found in system PATH")
 
 
-@app.route('/api/analyze-recordings', methods=['POST'])
-def analyze_recordings():
+# Analysis results may carry numpy values or non-string keys from the analyzers.
+# They are only machine-read, so they are compact unless PRETTY_JSON=1.
+ANALYSIS_JSON_OPTIONS = orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_APPEND_NEWLINE
+if os.environ.get('PRETTY_JSON') == '1':
+    ANALYSIS_JSON_OPTIONS |= orjson.OPT_INDENT_2
+
+
+def _save_analysis(results: dict, json_path: Path) -> str:
+    """Write analysis results as JSON and return the path as a string."""
+    with open(json_path, 'wb') as f:
+        f.write(orjson.dumps(results, option=ANALYSIS_JSON_OPTIONS))
+    return str(json_path)
+
+
+@functools.cache
+def _load_body_language_analyzer():
+    """Import the MediaPipe body language analyzer on first use."""
+    from body_language_module.body_language_analyzer import analyze_body_language
+    return analyze_body_language
+
+
+@functools.cache
+def _load_speech_analyzer():
+    """Import the speech confidence analyzer on first use."""
+    from confidence_analysis_module import analyze_speech
+    return analyze_speech
+
+
+@functools.cache
+def _get_modulation_analyzer():
+    """
+    Return the shared AssemblyAI speech modulation analyzer, creating it on first use.
+    
+    Raises:
+        ValueError: If the AssemblyAI API key is not configured (retried on the next call)
+    """
+    from speech_modulation_analysis import SpeechModulationAnalyzer
+    return SpeechModulationAnalyzer()
+
+
+async def _analyze_video_body_language(video_path: Path, recordings_dir: Path) -> str:
+    """Run body language analysis (MediaPipe) in a worker thread."""
+    # The first call imports MediaPipe; keep that off the event loop too
+    analyze_body_language = await asyncio.to_thread(_load_body_language_analyzer)
+    results = await asyncio.to_thread(analyze_body_language, str(video_path))
+    return _save_analysis(results, recordings_dir / f"{video_path.stem}_body_language_analysis.json")
+
+
+async def _analyze_video_speech_confidence(video_path: Path, recordings_dir: Path) -> str:
+    """Extract the audio track and run speech confidence analysis on it."""
+    audio_path = extracted_audio_path(video_path)
+    try:
+        await extract_audio_from_mp4(video_path, audio_path)
+        logger.info(f"  ✓ Audio extracted: {audio_path.name}")
+    except Exception as e:
+        # Clean up a partially written audio file
+        audio_path.unlink(missing_ok=True)
+        raise Exception(f"Audio extraction failed: {str(e)}")
+    
+    try:
+        analyze_speech = await asyncio.to_thread(_load_speech_analyzer)
+        speech_results = await asyncio.to_thread(analyze_speech, str(audio_path))
+        return _save_analysis(speech_results, recordings_dir / f"{video_path.stem}_speech_confidence_analysis.json")
+    except Exception as e:
+        raise Exception(f"Speech analysis failed: {str(e)}")
+    finally:
+        # Clean up extracted audio file
+        try:
+            audio_path.unlink()
+        except OSError:
+            pass  # Ignore cleanup errors
+
+
+# Upper bound on concurrent AssemblyAI transcriptions within one analysis
+MODULATION_CONCURRENCY = int(os.environ.get('MODULATION_CONCURRENCY', 8))
+
+
+def _run_modulation_analysis(video_path: Path, recordings_dir: Path, audio_path, cache_key: str) -> str:
+    """
+    Run speech modulation analysis (AssemblyAI) and return the JSON path.
+    
+    Raises:
+        ValueError: If the AssemblyAI API key is not configured
+    """
+    # Save next to the other analyses; the shared analyzer itself is not modified
+    _get_modulation_analyzer().analyze(
+        str(video_path), output_dir=recordings_dir, audio_path=audio_path, cache_key=cache_key
+    )
+    
+    modulation_json = recordings_dir / f"{video_path.stem}_modulation_analysis.json"
+    if not modulation_json.exists():
+        raise Exception("Modulation analysis file was not created at expected path")
+    return str(modulation_json)
+
+
+async def _extract_modulation_audio(mp4_files: list, recordings_dir: Path) -> dict:
+    """
+    Hash every recording, then extract the audio uploaded to AssemblyAI for all
+    recordings without cached results with one ffmpeg process.
+    
+    Returns:
+        {video path: (content digest, extracted audio path)}. The audio path is
+        None for recordings with cached results, or for every recording if the
+        batch failed (each analysis then extracts its own). Empty if AssemblyAI
+        is not configured; the modulation stage reports that.
+    """
+    try:
+        analyzer = await asyncio.to_thread(_get_modulation_analyzer)
+    except ValueError:
+        return {}
+    
+    cache_keys = await asyncio.gather(*(asyncio.to_thread(file_digest, path) for path in mp4_files))
+    prepared = {path: (cache_key, None) for path, cache_key in zip(mp4_files, cache_keys)}
+    pending = await asyncio.to_thread(
+        lambda: [path for path, cache_key in zip(mp4_files, cache_keys) if not analyzer.has_cached_results(cache_key)]
+    )
+    
+    if pending:
+        try:
+            audio_paths = await analyzer.extract_audio_batch_async(pending, recordings_dir)
+        except (RuntimeError, OSError) as e:
+            logger.warning(f"Batch audio extraction failed, extracting per recording: {e}")
+        else:
+            for path, audio_path in zip(pending, audio_paths):
+                prepared[path] = (prepared[path][0], audio_path)
+    return prepared
+
+
+async def _analyze_video_modulation(video_path: Path, recordings_dir: Path, modulation_audio, slots=None) -> str:
+    """
+    Wait for the shared hashing and batch audio extraction, then run modulation
+    analysis in a worker thread, holding one of the optional semaphore's slots
+    meanwhile. Recordings with cached results skip the upload inside analyze().
+    """
+    cache_key, audio_path = (await modulation_audio).get(video_path, (None, None))
+    async with slots or contextlib.nullcontext():
+        return await asyncio.to_thread(_run_modulation_analysis, video_path, recordings_dir, audio_path, cache_key)
+
+
+async def _tracked_stage(awaitable, emit, video_name: str, stage: str):
+    """Await one analysis stage and report its outcome through emit (if given)."""
+    try:
+        path = await awaitable
+    except Exception as e:
+        if emit:
+            emit('stage', {'video': video_name, 'stage': stage, 'error': str(e)})
+        raise
+    if emit:
+        emit('stage', {'video': video_name, 'stage': stage, 'path': path})
+    return path
+
+
+async def analyze_video(video_path: Path, recordings_dir: Path, modulation_audio, emit=None,
+                        modulation_slots=None) -> dict:
+    """
+    Run body language, speech confidence and speech modulation analysis on one
+    recording. The three analyses are independent and run concurrently.
+    
+    Args:
+        video_path: Path to the MP4 recording
+        recordings_dir: Directory the analysis JSON files are written to
+        modulation_audio: Shared future of _extract_modulation_audio() for all recordings
+        emit: Optional callable(event, payload) notified as each analysis finishes
+        modulation_slots: Optional asyncio.Semaphore shared by all videos' AssemblyAI calls
+    
+    Returns:
+        Dict with the JSON path of each analysis (None if it failed) and an 'errors' list
+    """
+    logger.info(f"Analyzing: {video_path.name}")
+    
+    video_results = {
+        'video_file': video_path.name,
+        'body_language': None,
+        'speech_confidence': None,
+        'speech_modulation': None,
+        'errors': []
+    }
+    
+    video_name = video_path.stem
+    body_language, speech_confidence, speech_modulation = await asyncio.gather(
+        _tracked_stage(_analyze_video_body_language(video_path, recordings_dir), emit, video_name, 'body_language'),
+        _tracked_stage(_analyze_video_speech_confidence(video_path, recordings_dir), emit, video_name, 'speech_confidence'),
+        _tracked_stage(_analyze_video_modulation(video_path, recordings_dir, modulation_audio, modulation_slots), emit, video_name, 'speech_modulation'),
+        return_exceptions=True
+    )
+    
+    # 1. Body Language Analysis
+    if isinstance(body_language, Exception):
+        error_msg = f"Body language analysis failed: {str(body_language)}"
+        logger.error(f"  ✗ {video_path.name}: {error_msg}")
+        video_results['errors'].append(error_msg)
+    else:
+        video_results['body_language'] = body_language
+        logger.info(f"  ✓ Body language analysis saved: {Path(body_language).name}")
+    
+    # 2. Speech Confidence Analysis
+    if isinstance(speech_confidence, Exception):
+        error_msg = f"Speech confidence analysis failed: {str(speech_confidence)}"
+        logger.error(f"  ✗ {video_path.name}: {error_msg}")
+        video_results['errors'].append(error_msg)
+    else:
+        video_results['speech_confidence'] = speech_confidence
+        logger.info(f"  ✓ Speech confidence analysis saved: {Path(speech_confidence).name}")
+    
+    # 3. Speech Modulation Analysis
+    if isinstance(speech_modulation, ValueError):
+        # AssemblyAI API key not found - skip this analysis
+        error_msg = f"Speech modulation analysis skipped: {str(speech_modulation)}"
+        logger.warning(f"  ⚠ {video_path.name}: {error_msg}")
+        video_results['errors'].append(error_msg)
+    elif isinstance(speech_modulation, Exception):
+        error_msg = f"Speech modulation analysis failed: {str(speech_modulation)}"
+        logger.error(f"  ✗ {video_path.name}: {error_msg}")
+        video_results['errors'].append(error_msg)
+    else:
+        video_results['speech_modulation'] = speech_modulation
+        logger.info(f"  ✓ Speech modulation analysis saved: {Path(speech_modulation).name}")
+    
+    return video_results
+
+
+# Upper bound on concurrent per-question Gemini feedback calls within one analysis,
+# so long interviews don't burst past the API rate limit
+FEEDBACK_CONCURRENCY = int(os.environ.get('FEEDBACK_CONCURRENCY', 5))
+
+
+# Instructions for the overall report; the per-question feedback is appended
+OVERALL_FEEDBACK_PROMPT = """
+You are an expert interview coach. Below is the analysis from some individual interview questions.
+Provide a comprehensive overall feedback report in JSON format.
+
+The JSON should have the following structure:
+{
+  "summary": "A brief overall summary of the candidate's performance",
+  "strengths": ["Strength 1", "Strength 2", ...],
+  "areas_for_improvement": ["Area 1", "Area 2", ...],
+  "consistency_analysis": "An evaluation of how consistent the candidate was across questions",
+  "communication_style": "Analysis of the candidate's communication style",
+  "confidence_score": "A score from 1-10",
+  "final_recommendation": "A clear recommendation written as if speaking directly to the candidate using 'you' (e.g., 'Based on your performance, I recommend...' or 'You demonstrated strong skills in...')"
+}
+
+IMPORTANT: The "final_recommendation" field should be written as if the interviewer is speaking directly to the candidate, using "you" to refer to them. For example: "Based on your performance across all questions, you demonstrated strong technical knowledge and clear communication. However, you could benefit from... We recommend..."
+
+Ensure the response is ONLY the JSON object, with no markdown formatting or extra text.
+
+Individual Question Feedback:
+"""
+
+
+# A reply wrapped in a markdown code block (``` or ~~~, optionally tagged json)
+CODE_FENCE_RE = re.compile(r'^\s*(```|~~~)(?:json)?\s*(.*?)\s*\1\s*$', re.DOTALL | re.IGNORECASE)
+
+
+def strip_code_fence(text: str) -> str:
+    """Return the contents of a fenced model reply, or the stripped text if it isn't fenced."""
+    match = CODE_FENCE_RE.match(text)
+    return match.group(2) if match else text.strip()
+
+
+def _load_json_file(path: Path):
+    """Read and parse a JSON file."""
+    with open(path, 'rb') as f:
+        return orjson.loads(f.read())
+
+
+# Passed to the feedback generator in place of eye contact results,
+# since eye contact analysis is not performed yet
+PLACEHOLDER_EYE_CONTACT = {
+    "overall_score": 0.5,
+    "assessment": "NOT_ANALYZED",
+    "interpretation": "Eye contact analysis not performed in this session",
+    "recommendations": ["Eye contact analysis will be added in future updates"]
+}
+
+
+async def run_analysis(data: dict, emit=None) -> tuple:
     """
     Analyze all MP4 recordings in user_recordings directory.
     Generates JSON files for body language, speech confidence, and speech modulation analysis.
     Then generates feedback for each recording.
     
-    Expects JSON body with:
-    - companyName (optional): Company name for feedback generation
-    - jobDescription (optional): Job description for feedback generation
-    - questions (optional): List of question objects with 'text' field
+    Args:
+        data: Request body with optional companyName, jobDescription, questions
+              (list of question objects with 'text' field) and sessionId
+        emit: Optional callable(event, payload) notified as each result is written
+    
+    Returns:
+        (response payload, HTTP status)
     """
+    company_name = data.get('companyName', '')
+    job_description = data.get('jobDescription', '')
+    questions_list = data.get('questions', [])
+    
     try:
-        data = request.get_json() or {}
-        company_name = data.get('companyName', '')
-        job_description = data.get('jobDescription', '')
-        questions_list = data.get('questions', [])
-        
-        recordings_dir = Path(__file__).parent / "user_recordings"
-        feedback_dir = Path(__file__).parent / "interview_feedback"
-        feedback_dir.mkdir(exist_ok=True)
-        
-        if not recordings_dir.exists():
-            return jsonify({
-                'success': False,
-                'error': 'user_recordings directory does not exist'
-            }), 404
-        
-        # Get all MP4 files
-        mp4_files = sorted(list(recordings_dir.glob("*.mp4")))
-        
-        if not mp4_files:
-            return jsonify({
-                'success': False,
-                'error': 'No MP4 files found in user_recordings directory'
-            }), 404
-        
-        print(f"=" * 60)
-        print(f"Analyzing {len(mp4_files)} recording(s)")
-        print(f"=" * 60)
+        recordings_dir = get_recordings_dir(data.get('sessionId'))
+        feedback_dir = get_feedback_dir(data.get('sessionId'))
+    except ValueError as e:
+        return {
+            'success': False,
+            'error': str(e)
+        }, 400
+    # Per session, so concurrent sessions never mix their feedback files
+    feedback_dir.mkdir(exist_ok=True)
+    
+    if RECORDINGS_BUCKET:
+        fetched = await fetch_direct_uploads(data.get('sessionId'), recordings_dir)
+        if fetched:
+            logger.info(f"Fetched {fetched} recording(s) from S3")
+    
+    if not recordings_dir.exists():
+        return {
+            'success': False,
+            'error': 'user_recordings directory does not exist'
+        }, 404
+    
+    # Get all MP4 files
+    mp4_files = sorted(recordings_dir.glob("*.mp4"))
+    
+    if not mp4_files:
+        return {
+            'success': False,
+            'error': 'No MP4 files found in user_recordings directory'
+        }, 404
+    
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug("=" * 60)
+    logger.info(f"Analyzing {len(mp4_files)} recording(s)")
+    
+    # One ffmpeg process extracts the AssemblyAI audio of every recording while
+    # the body language and speech confidence analyses already run
+    modulation_audio = asyncio.ensure_future(_extract_modulation_audio(mp4_files, recordings_dir))
+    modulation_slots = asyncio.Semaphore(MODULATION_CONCURRENCY)
+    
+    # Videos are independent, and so are the three analyses of one video
+    video_results = await asyncio.gather(*(
+        analyze_video(video_path, recordings_dir, modulation_audio, emit, modulation_slots)
+        for video_path in mp4_files
+    ))
+    results = {video_path.stem: result for video_path, result in zip(mp4_files, video_results)}
+    
+    # Generate feedback for each recording if we have all required data
+    if company_name and job_description and questions_list:
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("=" * 60)
+        logger.info("Generating Feedback")
         
-        results = {}
+        try:
+            feedback_generator = InterviewFeedbackGenerator()
+        except ValueError as e:
+            logger.warning(f"⚠ Feedback generation skipped: {str(e)}")
+            feedback_generator = None
         
-        for video_path in mp4_files:
-            base_name = video_path.stem
-            print(f"\nAnalyzing: {video_path.name}")
-            
-            video_results = {
-                'video_file': video_path.name,
-                'body_language': None,
-                'speech_confidence': None,
-                'speech_modulation': None,
-                'errors': []
-            }
-            
-            # 1. Body Language Analysis
-            try:
-                print(f"  → Analyzing body language...")
-                body_language_results = analyze_body_language(str(video_path))
-                body_language_json = recordings_dir / f"{base_name}_body_language_analysis.json"
-                with open(body_language_json, 'w') as f:
-                    json.dump(body_language_results, f, indent=2)
-                video_results['body_language'] = str(body_language_json)
-                print(f"  ✓ Body language analysis saved: {body_language_json.name}")
-            except Exception as e:
-                error_msg = f"Body language analysis failed: {str(e)}"
-                print(f"  ✗ {error_msg}")
-                video_results['errors'].append(error_msg)
+        if feedback_generator:
+            # Resolve question texts once; recordings with an unknown number
+            # fall back to the first question
+            question_texts = {i: question.get('text', '') for i, question in enumerate(questions_list, 1)}
+            default_question_text = question_texts.get(1, '')
+            feedback_slots = asyncio.Semaphore(FEEDBACK_CONCURRENCY)
             
-            # 2. Speech Confidence Analysis
-            try:
-                print(f"  → Analyzing speech confidence...")
+            async def generate_video_feedback(video_path: Path):
+                base_name = video_path.stem
+                match = RECORDING_QUESTION_NUMBER_RE.search(base_name)
+                if match:
+                    question_text = question_texts.get(int(match.group(1)), default_question_text)
+                else:
+                    question_text = default_question_text
                 
-                # Extract audio from MP4
-                try:
-                    audio_path = extract_audio_from_mp4(video_path)
-                    print(f"  ✓ Audio extracted: {audio_path.name}")
-                except Exception as e:
-                    raise Exception(f"Audio extraction failed: {str(e)}")
+                if not question_text:
+                    logger.warning(f"  ⚠ Skipping feedback for {base_name}: No question text available")
+                    return
                 
-                # Analyze speech
-                try:
-                    speech_results = analyze_speech(str(audio_path))
-                    speech_json = recordings_dir / f"{base_name}_speech_confidence_analysis.json"
-                    with open(speech_json, 'w') as f:
-                        json.dump(speech_results, f, indent=2)
-                    video_results['speech_confidence'] = str(speech_json)
-                    print(f"  ✓ Speech confidence analysis saved: {speech_json.name}")
-                    
-                    # Clean up extracted audio file
-                    try:
-                        audio_path.unlink()
-                    except:
-                        pass  # Ignore cleanup errors
-                except Exception as e:
-                    raise Exception(f"Speech analysis failed: {str(e)}")
+                # Get analysis file paths
+                body_language_json = recordings_dir / f"{base_name}_body_language_analysis.json"
+                speech_json = recordings_dir / f"{base_name}_speech_confidence_analysis.json"
+                modulation_json = recordings_dir / f"{base_name}_modulation_analysis.json"
+                
+                # Check if all required analysis files exist (the stat calls run in a worker thread)
+                analysis_files = (body_language_json, speech_json, modulation_json)
+                if not await asyncio.to_thread(lambda: all(path.exists() for path in analysis_files)):
+                    logger.warning(f"  ⚠ Skipping feedback for {base_name}: Missing analysis files")
+                    return
                 
-            except Exception as e:
-                error_msg = f"Speech confidence analysis failed: {str(e)}"
-                print(f"  ✗ {error_msg}")
-                video_results['errors'].append(error_msg)
-                # Clean up audio file if it exists
-                audio_path = video_path.with_suffix(".wav")
-                if audio_path.exists():
-                    try:
-                        audio_path.unlink()
-                    except:
-                        pass
-            
-            # 3. Speech Modulation Analysis
-            try:
-                print(f"  → Analyzing speech modulation...")
                 try:
-                    modulation_analyzer = SpeechModulationAnalyzer()
-                    # Temporarily set output_dir to save in same location as other analyses
-                    original_output_dir = modulation_analyzer.output_dir
-                    modulation_analyzer.output_dir = recordings_dir
-                    
-                    # Run analysis - this will save the file to self.output_dir
-                    modulation_results = modulation_analyzer.analyze(str(video_path))
-                    
-                    # The analyze method saves the file using output_dir, so get the expected path
-                    modulation_json = recordings_dir / f"{base_name}_modulation_analysis.json"
+                    async with feedback_slots:
+                        logger.info(f"  → Generating feedback for {base_name}...")
+                        feedback = await asyncio.to_thread(
+                            feedback_generator.generate_feedback,
+                            company_name=company_name,
+                            job_description=job_description,
+                            question_text=question_text,
+                            speech_confidence_json_path=str(speech_json),
+                            body_language_json_path=str(body_language_json),
+                            eye_contact_json_path=None,
+                            modulation_json_path=str(modulation_json),
+                            eye_contact_data=PLACEHOLDER_EYE_CONTACT
+                        )
                     
-                    # Verify file was created (in case analyze() saved to a different location)
-                    if not modulation_json.exists():
-                        # Check if it was saved to the original output_dir instead
-                        possible_path = original_output_dir / f"{base_name}_modulation_analysis.json"
-                        if possible_path.exists():
-                            # Move it to the correct location
-                            import shutil
-                            shutil.move(str(possible_path), str(modulation_json))
-                            print(f"  ✓ Moved modulation file to correct location")
-                        else:
-                            raise Exception(f"Modulation analysis file was not created at expected path")
+                    # Save feedback; the write runs in a worker thread so other
+                    # recordings' feedback is saved in parallel
+                    feedback_json = feedback_dir / f"{base_name}_feedback.json"
+                    await asyncio.to_thread(feedback_generator.save_feedback, feedback, str(feedback_json))
                     
-                    # Restore original output_dir
-                    modulation_analyzer.output_dir = original_output_dir
-                    video_results['speech_modulation'] = str(modulation_json)
-                    print(f"  ✓ Speech modulation analysis saved: {modulation_json.name}")
+                    results[base_name]['feedback'] = str(feedback_json)
+                    if emit:
+                        emit('feedback', {'video': base_name, 'path': str(feedback_json)})
+                    logger.info(f"  ✓ Feedback saved: {feedback_json.name}")
                     
-                except ValueError as e:
-                    # AssemblyAI API key not found - skip this analysis
-                    error_msg = f"Speech modulation analysis skipped: {str(e)}"
-                    print(f"  ⚠ {error_msg}")
-                    video_results['errors'].append(error_msg)
                 except Exception as e:
-                    raise Exception(f"Speech modulation analysis failed: {str(e)}")
-            except Exception as e:
-                error_msg = f"Speech modulation analysis failed: {str(e)}"
-                print(f"  ✗ {error_msg}")
-                video_results['errors'].append(error_msg)
+                    error_msg = f"Feedback generation failed for {base_name}: {str(e)}"
+                    logger.error(f"  ✗ {error_msg}")
+                    # analyze_video() always initializes the errors list
+                    results[base_name]['errors'].append(error_msg)
             
-            results[base_name] = video_results
+            # The Gemini calls for different questions run concurrently (bounded by
+            # FEEDBACK_CONCURRENCY); each result is saved and emitted as it completes
+            await asyncio.gather(*(generate_video_feedback(video_path) for video_path in mp4_files))
         
-        # Generate feedback for each recording if we have all required data
-        if company_name and job_description and questions_list:
-            print(f"\n" + "=" * 60)
-            print(f"Generating Feedback")
-            print(f"=" * 60)
-            
-            # Create a placeholder eye_contact JSON file (since we're not doing eye contact analysis yet)
-            placeholder_eye_contact = {
-                "overall_score": 0.5,
-                "assessment": "NOT_ANALYZED",
-                "interpretation": "Eye contact analysis not performed in this session",
-                "recommendations": ["Eye contact analysis will be added in future updates"]
-            }
-            placeholder_eye_contact_path = recordings_dir / "placeholder_eye_contact.json"
-            with open(placeholder_eye_contact_path, 'w') as f:
-                json.dump(placeholder_eye_contact, f, indent=2)
-            
+        # Generate overall feedback from all individual feedback files
+        if feedback_generator:
             try:
-                feedback_generator = InterviewFeedbackGenerator()
-            except ValueError as e:
-                print(f"⚠ Feedback generation skipped: {str(e)}")
-                feedback_generator = None
-            
-            if feedback_generator:
-                for video_path in mp4_files:
-                    base_name = video_path.stem
-                    # Extract question number from base_name (e.g., "user_answer_1" -> 1)
-                    try:
-                        question_num = int(base_name.split('_')[-1])
-                        if 1 <= question_num <= len(questions_list):
-                            question_text = questions_list[question_num - 1].get('text', '')
+                if logger.isEnabledFor(logging.DEBUG):
+                    logger.debug("=" * 60)
+                logger.info("Generating Overall Feedback")
+                
+                # Load all individual feedback files
+                all_feedback_files = sorted(feedback_dir.glob("user_answer_*_feedback.json"))
+                
+                if all_feedback_files:
+                    logger.info(f"  → Loading {len(all_feedback_files)} feedback file(s)...")
+                    # Read the files concurrently; results keep the sorted file order
+                    loaded = await asyncio.gather(
+                        *(asyncio.to_thread(_load_json_file, feedback_file) for feedback_file in all_feedback_files),
+                        return_exceptions=True
+                    )
+                    all_feedback_data = []
+                    for feedback_file, feedback_data in zip(all_feedback_files, loaded):
+                        if isinstance(feedback_data, Exception):
+                            logger.warning(f"  ⚠ Failed to load {feedback_file.name}: {feedback_data}")
                         else:
-                            question_text = questions_list[0].get('text', '') if questions_list else ''
-                    except (ValueError, IndexError):
-                        question_text = questions_list[0].get('text', '') if questions_list else ''
-                    
-                    if not question_text:
-                        print(f"  ⚠ Skipping feedback for {base_name}: No question text available")
-                        continue
+                            all_feedback_data.append(feedback_data)
                     
-                    # Get analysis file paths
-                    body_language_json = recordings_dir / f"{base_name}_body_language_analysis.json"
-                    speech_json = recordings_dir / f"{base_name}_speech_confidence_analysis.json"
-                    modulation_json = recordings_dir / f"{base_name}_modulation_analysis.json"
-                    
-                    # Check if all required analysis files exist
-                    if not body_language_json.exists() or not speech_json.exists() or not modulation_json.exists():
-                        print(f"  ⚠ Skipping feedback for {base_name}: Missing analysis files")
-                        continue
-                    
-                    try:
-                        print(f"\n  → Generating feedback for {base_name}...")
-                        feedback = feedback_generator.generate_feedback(
-                            company_name=company_name,
-                            job_description=job_description,
-                            question_text=question_text,
-                            speech_confidence_json_path=str(speech_json),
-                            body_language_json_path=str(body_language_json),
-                            eye_contact_json_path=str(placeholder_eye_contact_path),
-                            modulation_json_path=str(modulation_json)
-                        )
-                        
-                        # Save feedback
-                        feedback_json = feedback_dir / f"{base_name}_feedback.json"
-                        feedback_generator.save_feedback(feedback, str(feedback_json))
+                    if all_feedback_data:
+                        logger.info(f"  → Generating overall feedback from {len(all_feedback_data)} question(s)...")
                         
-                        results[base_name]['feedback'] = str(feedback_json)
-                        print(f"  ✓ Feedback saved: {feedback_json.name}")
+                        # Create the prompt
+                        parts = []
+                        for i, feedback in enumerate(all_feedback_data, 1):
+                            parts.append(f"\n\n--- Question {i} Feedback ---\n")
+                            if isinstance(feedback, dict) and 'feedback' in feedback:
+                                parts.extend(f"- {bullet}\n" for bullet in feedback['feedback'])
+                            else:
+                                parts.append(str(feedback) + "\n")
+                        feedback_text = "".join(parts)
                         
-                    except Exception as e:
-                        error_msg = f"Feedback generation failed for {base_name}: {str(e)}"
-                        print(f"  ✗ {error_msg}")
-                        if 'errors' not in results[base_name]:
-                            results[base_name]['errors'] = []
-                        results[base_name]['errors'].append(error_msg)
-            
-            # Clean up placeholder file
-            if placeholder_eye_contact_path.exists():
-                try:
-                    placeholder_eye_contact_path.unlink()
-                except:
-                    pass
-            
-            # Generate overall feedback from all individual feedback files
-            if feedback_generator:
-                try:
-                    print(f"\n" + "=" * 60)
-                    print(f"Generating Overall Feedback")
-                    print(f"=" * 60)
-                    
-                    # Load all individual feedback files
-                    all_feedback_files = sorted(list(feedback_dir.glob("user_answer_*_feedback.json")))
-                    
-                    if all_feedback_files:
-                        print(f"  → Loading {len(all_feedback_files)} feedback file(s)...")
-                        all_feedback_data = []
+                        prompt = OVERALL_FEEDBACK_PROMPT + feedback_text
                         
-                        for feedback_file in all_feedback_files:
-                            try:
-                                with open(feedback_file, 'r') as f:
-                                    feedback_data = json.load(f)
-                                    all_feedback_data.append(feedback_data)
-                            except Exception as e:
-                                print(f"  ⚠ Failed to load {feedback_file.name}: {e}")
+                        # Identical per-question feedback yields the same overall report
+                        overall_cache_key = "overall_feedback:" + hashlib.blake2b(
+                            feedback_text.encode('utf-8'), digest_size=16
+                        ).hexdigest()
+                        cached_overall = response_cache.get(overall_cache_key)
                         
-                        if all_feedback_data:
-                            print(f"  → Generating overall feedback from {len(all_feedback_data)} question(s)...")
-                            
-                            # Create the prompt
-                            feedback_text = ""
-                            for i, feedback in enumerate(all_feedback_data, 1):
-                                feedback_text += f"\n\n--- Question {i} Feedback ---\n"
-                                if isinstance(feedback, dict) and 'feedback' in feedback:
-                                    for bullet in feedback['feedback']:
-                                        feedback_text += f"- {bullet}\n"
-                                else:
-                                    feedback_text += str(feedback) + "\n"
-                            
-                            prompt = """
-        You are an expert interview coach. Below is the analysis from some individual interview questions. 
-        Provide a comprehensive overall feedback report in JSON format.
-        
-        The JSON should have the following structure:
-        {
-          "summary": "A brief overall summary of the candidate's performance",
-          "strengths": ["Strength 1", "Strength 2", ...],
-          "areas_for_improvement": ["Area 1", "Area 2", ...],
-          "consistency_analysis": "An evaluation of how consistent the candidate was across questions",
-          "communication_style": "Analysis of the candidate's communication style",
-          "confidence_score": "A score from 1-10",
-          "final_recommendation": "A clear recommendation written as if speaking directly to the candidate using 'you' (e.g., 'Based on your performance, I recommend...' or 'You demonstrated strong skills in...')"
-        }
-        
-        IMPORTANT: The "final_recommendation" field should be written as if the interviewer is speaking directly to the candidate, using "you" to refer to them. For example: "Based on your performance across all questions, you demonstrated strong technical knowledge and clear communication. However, you could benefit from... We recommend..."
-        
-        Ensure the response is ONLY the JSON object, with no markdown formatting or extra text.
-        
-        Individual Question Feedback:
-        """ + feedback_text
-                            
+                        if cached_overall is not None:
+                            logger.info("  ✓ Reusing cached overall feedback")
+                            response_text = cached_overall.decode('utf-8')
+                        else:
                             # Generate overall feedback using Gemini
-                            response = feedback_generator.model.generate_content(prompt)
-                            response_text = response.text.strip()
-                            
-                            # Remove markdown code blocks if present
-                            if response_text.startswith("```json"):
-                                response_text = response_text[7:]
-                            elif response_text.startswith("```"):
-                                response_text = response_text[3:]
+                            response = await asyncio.to_thread(feedback_generator.model.generate_content, prompt)
+                            response_text = strip_code_fence(response.text)
+                        
+                        try:
+                            overall_feedback = orjson.loads(response_text)
+                            if cached_overall is None:
+                                response_cache.set(overall_cache_key, response_text.encode('utf-8'))
                             
-                            if response_text.endswith("```"):
-                                response_text = response_text[:-3]
+                            # Save overall feedback
+                            overall_feedback_json = feedback_dir / "overall_feedback.json"
+                            await asyncio.to_thread(
+                                overall_feedback_json.write_bytes,
+                                orjson.dumps(overall_feedback, option=orjson.OPT_INDENT_2)
+                            )
                             
-                            response_text = response_text.strip()
+                            logger.info(f"  ✓ Overall feedback saved: {overall_feedback_json.name}")
+                            if emit:
+                                emit('overall_feedback', {'path': str(overall_feedback_json)})
                             
-                            try:
-                                overall_feedback = json.loads(response_text)
-                                
-                                # Save overall feedback
-                                overall_feedback_json = feedback_dir / "overall_feedback.json"
-                                with open(overall_feedback_json, 'w') as f:
-                                    json.dump(overall_feedback, f, indent=2, ensure_ascii=False)
-                                
-                                print(f"  ✓ Overall feedback saved: {overall_feedback_json.name}")
-                                
-                            except json.JSONDecodeError as e:
-                                print(f"  ✗ Failed to parse overall feedback JSON: {e}")
-                                print(f"  Response: {response_text[:200]}...")
-                        else:
-                            print(f"  ⚠ No valid feedback data found to generate overall feedback")
+                        except orjson.JSONDecodeError as e:
+                            logger.error(f"  ✗ Failed to parse overall feedback JSON: {e}")
+                            logger.error(f"  Response: {response_text[:200]}...")
                     else:
-                        print(f"  ⚠ No individual feedback files found")
-                        
-                except Exception as e:
-                    print(f"  ✗ Overall feedback generation failed: {str(e)}")
-                    import traceback
-                    traceback.print_exc()
-        
-        print(f"\n" + "=" * 60)
-        print(f"Analysis Complete!")
-        print(f"=" * 60)
-        
-        return jsonify({
-            'success': True,
-            'message': f'Analyzed {len(mp4_files)} recording(s)',
-            'results': results
-        }), 200
+                        logger.warning("  ⚠ No valid feedback data found to generate overall feedback")
+                else:
+                    logger.warning("  ⚠ No individual feedback files found")
+                    
+            except Exception as e:
+                logger.exception(f"  ✗ Overall feedback generation failed: {str(e)}")
+    
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug("=" * 60)
+    logger.info("Analysis Complete!")
+    
+    return {
+        'success': True,
+        'message': f'Analyzed {len(mp4_files)} recording(s)',
+        'results': results
+    }, 200
+
+
+# Streamed analyses run on this bounded pool instead of one thread per request
+ANALYSIS_WORKERS = int(os.environ.get('ANALYSIS_WORKERS', 2))
+_analysis_executor = ThreadPoolExecutor(max_workers=ANALYSIS_WORKERS, thread_name_prefix="analyze-recordings")
+
+# Recordings directories being analyzed by this process; the flock()ed files in
+# ANALYSIS_LOCK_DIR extend the guard to the other gunicorn workers
+_analyses_in_flight = set()
+_analyses_in_flight_lock = threading.Lock()
+ANALYSIS_LOCK_DIR = FEEDBACK_DIR / ".locks"
+ANALYSIS_LOCK_DIR.mkdir(exist_ok=True)
+
+
+def claim_analysis(session_id: str = None):
+    """
+    Claim the single analysis slot of a session's recordings directory.
+    
+    Args:
+        session_id: Optional session ID; must match SESSION_ID_RE
+    
+    Returns:
+        Callable releasing the slot, or None if that session is already being analyzed
+    
+    Raises:
+        ValueError: If session_id is invalid
+    """
+    recordings_dir = get_recordings_dir(session_id)
+    with _analyses_in_flight_lock:
+        if recordings_dir in _analyses_in_flight:
+            return None
+        _analyses_in_flight.add(recordings_dir)
+    
+    lock_fd = None
+    if fcntl is not None:
+        lock_name = f"session-{session_id}.lock" if session_id else "default.lock"
+        lock_fd = os.open(ANALYSIS_LOCK_DIR / lock_name, os.O_RDWR | os.O_CREAT, 0o644)
+        try:
+            fcntl.flock(lock_fd, fcntl.LOCK_EX | fcntl.LOCK_NB)
+        except BlockingIOError:
+            os.close(lock_fd)
+            with _analyses_in_flight_lock:
+                _analyses_in_flight.discard(recordings_dir)
+            return None
+    
+    def release():
+        if lock_fd is not None:
+            os.close(lock_fd)  # Also drops the flock
+        with _analyses_in_flight_lock:
+            _analyses_in_flight.discard(recordings_dir)
+    
+    return release
+
+
+ANALYSIS_IN_PROGRESS = {
+    'success': False,
+    'error': 'An analysis of this session is already in progress'
+}
+
+
+@api.route('/api/analyze-recordings', methods=['POST'])
+async def analyze_recordings():
+    """
+    Analyze all MP4 recordings and return every result in one response.
+    
+    Expects JSON body with:
+    - companyName (optional): Company name for feedback generation
+    - jobDescription (optional): Job description for feedback generation
+    - questions (optional): List of question objects with 'text' field
+    """
+    data = request.get_json() or {}
+    try:
+        release = claim_analysis(data.get('sessionId'))
+    except ValueError as e:
+        return _json({
+            'success': False,
+            'error': str(e)
+        }, 400)
+    if release is None:
+        return _json(ANALYSIS_IN_PROGRESS, 409)
+    
+    try:
+        payload, status = await run_analysis(data)
+        return _json(payload, status)
         
     except Exception as e:
-        print(f"Error analyzing recordings: {e}")
-        import traceback
-        traceback.print_exc()
-        return jsonify({
+        logger.exception(f"Error analyzing recordings: {e}")
+        return _json({
             'success': False,
             'error': f'Error analyzing recordings: {str(e)}'
-        }), 500
+        }, 500)
+    finally:
+        release()
+
+
+@api.route('/api/analyze-recordings-stream', methods=['POST'])
+def analyze_recordings_stream():
+    """
+    Analyze all MP4 recordings, streaming progress as Server-Sent Events.
+    
+    Takes the same JSON body as /api/analyze-recordings. A "stage" event is sent
+    as each analysis of each video finishes (in completion order), followed by
+    "feedback" / "overall_feedback" events and finally "done" with the payload
+    /api/analyze-recordings would return (or "error").
+    
+    The analysis runs on a bounded worker pool and keeps going (writing its
+    results) if the client disconnects; until it finishes, further analyses of
+    the same session are rejected with 409.
+    """
+    data = request.get_json(silent=True) or {}
+    try:
+        release = claim_analysis(data.get('sessionId'))
+    except ValueError as e:
+        return _json({
+            'success': False,
+            'error': str(e)
+        }, 400)
+    if release is None:
+        return _json(ANALYSIS_IN_PROGRESS, 409)
+    events = queue.Queue()
+    
+    def worker():
+        try:
+            payload, status = asyncio.run(run_analysis(data, emit=lambda event, payload: events.put((event, payload))))
+            events.put(('done' if status == 200 else 'error', payload))
+        except Exception as e:
+            logger.exception(f"Error analyzing recordings: {e}")
+            events.put(('error', {
+                'success': False,
+                'error': f'Error analyzing recordings: {str(e)}'
+            }))
+        finally:
+            release()
+            events.put(None)
+    
+    try:
+        _analysis_executor.submit(worker)
+    except RuntimeError:  # Executor shut down at interpreter exit
+        release()
+        raise
+    
+    def generate():
+        while (item := events.get()) is not None:
+            event, payload = item
+            yield _sse(payload, event=event)
+    
+    return Response(
+        generate(),
+        mimetype='text/event-stream',
+        headers={
+            'Cache-Control': 'no-cache',
+            'X-Accel-Buffering': 'no'
+        }
+    )
+
+
+# Last served overall feedback per feedback directory as (mtime_ns, size, body);
+# the frontend polls this endpoint, and a file only changes when an analysis finishes
+_overall_feedback_cache = TTLCache(maxsize=256, ttl=3600)
+_overall_feedback_cache_lock = threading.Lock()
 
 
-@app.route('/api/get-overall-feedback', methods=['GET'])
+@api.route('/api/get-overall-feedback', methods=['GET'])
 def get_overall_feedback():
     """
-    Get the overall feedback JSON file.
+    Get the overall feedback JSON file (of the session given by the optional
+    sessionId query parameter).
     """
     try:
-        feedback_dir = Path(__file__).parent / "interview_feedback"
+        try:
+            feedback_dir = get_feedback_dir(request.args.get('sessionId'))
+        except ValueError as e:
+            return _json({
+                'success': False,
+                'error': str(e)
+            }, 400)
         overall_feedback_path = feedback_dir / "overall_feedback.json"
         
-        if not overall_feedback_path.exists():
-            return jsonify({
+        try:
+            stat = overall_feedback_path.stat()
+        except FileNotFoundError:
+            return _json({
                 'success': False,
                 'error': 'Overall feedback not found'
-            }), 404
+            }, 404)
         
-        with open(overall_feedback_path, 'r') as f:
-            overall_feedback = json.load(f)
+        with _overall_feedback_cache_lock:
+            cached = _overall_feedback_cache.get(feedback_dir)
+        if cached is not None and cached[:2] == (stat.st_mtime_ns, stat.st_size):
+            body = cached[2]
+        else:
+            # The file is JSON written by run_analysis; serve it without re-parsing
+            body = overall_feedback_path.read_bytes()
+            with _overall_feedback_cache_lock:
+                _overall_feedback_cache[feedback_dir] = (stat.st_mtime_ns, stat.st_size, body)
         
-        return jsonify(overall_feedback), 200
+        etag = f"{stat.st_mtime_ns:x}-{stat.st_size:x}"
+        if _if_none_match(etag):
+            response = Response(status=304)
+        else:
+            response = Response(body, status=200, mimetype='application/json')
+        response.set_etag(etag)
+        response.cache_control.no_cache = True  # Always revalidate; it changes per analysis
+        return response
         
     except Exception as e:
-        print(f"Error getting overall feedback: {e}")
-        import traceback
-        traceback.print_exc()
-        return jsonify({
+        logger.exception(f"Error getting overall feedback: {e}")
+        return _json({
             'success': False,
             'error': f'Error getting overall feedback: {str(e)}'
-        }), 500
+        }, 500)
 
 
-@app.route('/health', methods=['GET'])
+def _if_none_match(etag: str) -> bool:
+    """
+    Check the request's If-None-Match header against an ETag.
+    
+    flask-compress rewrites the ETag of compressed responses to "<tag>:br" or
+    "<tag>:gzip" (and may mark it weak), and browsers send that tag back, so
+    the encoding suffix is ignored when comparing.
+    """
+    if_none_match = request.if_none_match
+    if if_none_match.star_tag:
+        return True
+    return any(tag.split(':', 1)[0] == etag for tag in if_none_match.as_set(include_weak=True))
+
+
+@api.route('/health', methods=['GET'])
 def health():
     """Health check endpoint."""
-    return jsonify({'status': 'ok'}), 200
+    return _json({'status': 'ok'}, 200)
 
 
 # Serve React frontend static files
 static_dir = Path(__file__).parent / "static"
 
-@app.route('/', defaults={'path': ''})
-@app.route('/<path:path>')
+@frontend.route('/', defaults={'path': ''})
+@frontend.route('/<path:path>')
 def serve_frontend(path):
     """Serve the React frontend for all non-API routes."""
     if path.startswith('api/'):
         # Don't serve static files for API routes
-        return jsonify({'error': 'Not found'}), 404
+        return _json({'error': 'Not found'}, 404)
     
     # Serve index.html for all routes (React Router handles client-side routing)
     if path == '' or not (static_dir / path).exists():
@@ -799,7 +2080,46 @@ def serve_frontend(path):
     if static_dir.exists() and (static_dir / 'index.html').exists():
         return send_from_directory(str(static_dir), 'index.html')
     
-    return jsonify({'error': 'Frontend not found. Please build the frontend first.'}), 404
+    return _json({'error': 'Frontend not found. Please build the frontend first.'}, 404)
+
+
+def create_app(*, tts: bool = True) -> Flask:
+    """
+    Build the Flask application.
+    
+    Args:
+        tts: Whether to register the ElevenLabs text-to-speech endpoints
+    
+    Returns:
+        Configured Flask app
+    """
+    app = Flask(__name__)
+    CORS(app)  # Enable CORS for frontend
+    # API payloads go through orjson; keep Flask's own JSON (e.g. errors) unsorted too
+    app.json.sort_keys = False
+    
+    # Compress JSON/text responses (analysis payloads can be several MB).
+    # MP3 audio is already compressed, so it is deliberately not listed here.
+    app.config['COMPRESS_ALGORITHM'] = ['br', 'gzip']
+    app.config['COMPRESS_LEVEL'] = 4
+    app.config['COMPRESS_BR_LEVEL'] = 4
+    app.config['COMPRESS_MIMETYPES'] = [
+        'application/json',
+        'text/html',
+        'text/css',
+        'text/javascript',
+        'application/javascript',
+    ]
+    Compress(app)
+    
+    app.register_blueprint(api)
+    if tts:
+        app.register_blueprint(tts_api)
+    app.register_blueprint(frontend)
+    return app
+
+
+app = create_app(tts=ENABLE_TTS)
 
 
 if __name__ == '__main__':
@@ -807,4 +2127,6 @@ if __name__ == '__main__':
     port = int(os.environ.get('PORT', 5000))
     # Only run in debug mode if explicitly set
     debug = os.environ.get('FLASK_DEBUG', 'False').lower() == 'true'
+    if ENABLE_TTS:
+        threading.Thread(target=preconnect, name="preconnect", daemon=True).start()
     app.run(host='0.0.0.0', debug=debug, port=port)
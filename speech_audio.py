@@ -0,0 +1,14 @@
+"""
+ffmpeg settings for audio uploaded to speech recognition services.
+
+Shared by the AssemblyAI modulation analysis and the ElevenLabs speech-to-text
+converter, so both extraction paths produce the same audio.
+"""
+
+# Downmix, loudness-normalize and resample in one filter graph (a single decode
+# pass). aformat downmixes any input layout, unlike a fixed stereo pan expression.
+AUDIO_UPLOAD_FILTER = "aformat=channel_layouts=mono,loudnorm=I=-16:TP=-1.5:LRA=11,aresample=16000"
+
+# Speech recognition needs no more than 16 kHz mono; low-bitrate Opus is cheap to
+# encode and a fraction of the size of a default MP3, so the upload is faster
+AUDIO_UPLOAD_ARGS = ("-af", AUDIO_UPLOAD_FILTER, "-c:a", "libopus", "-b:a", "24k")
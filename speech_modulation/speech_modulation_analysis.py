@@ -7,17 +7,51 @@ Analyzes MP4 videos/audio for:
 - Prosody & Speech Rate (WPM, pauses)
 """
 
+import asyncio
 import os
+import re
+import sys
 import time
 import subprocess
-import json
+from collections import Counter
+from operator import attrgetter
 from pathlib import Path
 from dotenv import load_dotenv
 import assemblyai as aai
+import httpx
+import numpy as np
+import orjson
+
+# Shared cache and ffmpeg helpers live in the repository root, which is on the path when
+# running the server or this module with "python -m" from the repository root
+from file_cache import evict_lru, file_digest, has_entry, read_entry, write_atomic
+from speech_audio import AUDIO_UPLOAD_ARGS
 
 # Load environment variables
 load_dotenv()
 
+# Results are read by the feedback generator, so they are written compactly;
+# set PRETTY_JSON=1 for indented output when inspecting them by hand
+RESULT_JSON_OPTIONS = orjson.OPT_APPEND_NEWLINE | (orjson.OPT_INDENT_2 if os.getenv("PRETTY_JSON") == "1" else 0)
+
+# Disfluencies counted as filler words
+FILLER_WORDS = frozenset({"um", "uh", "hmm", "mhm", "uh-huh", "ah", "huh", "m"})
+# Whole-word, case-insensitive match allowing surrounding commas and periods;
+# equivalent to text.lower().strip(",.") in FILLER_WORDS without the copies
+FILLER_RE = re.compile(
+    r"[,.]*(?:%s)[,.]*" % "|".join(map(re.escape, sorted(FILLER_WORDS, key=len, reverse=True))),
+    re.IGNORECASE
+)
+
+# Seconds to wait before each retry of a transcription that failed in transit
+TRANSCRIBE_RETRY_DELAYS = (1, 5, 15)
+
+# Results of previously analyzed files, keyed by content hash; the least recently
+# used entries are evicted beyond this count
+RESULT_CACHE_MAX_ENTRIES = 100
+# Cached results are re-analyzed after a week, e.g. to pick up model improvements
+RESULT_CACHE_TTL = 7 * 24 * 60 * 60
+
 class SpeechModulationAnalyzer:
     def __init__(self, api_key=None):
         self.api_key = api_key or os.getenv("ASSEMBLYAI_API_KEY")
@@ -25,31 +59,123 @@ class SpeechModulationAnalyzer:
             raise ValueError("AssemblyAI API key not found. Please set ASSEMBLYAI_API_KEY in .env")
         
         aai.settings.api_key = self.api_key
+        # One transcriber (and its HTTP connection pool) serves every analysis
+        self.transcriber = aai.Transcriber()
         self.output_dir = Path("output")
         self.output_dir.mkdir(exist_ok=True)
+        self.cache_dir = self.output_dir / ".cache"
+        self.cache_dir.mkdir(exist_ok=True)
+
+    def _cached_results(self, key):
+        """Returns cached analysis results for a content hash, or None."""
+        data = read_entry(self.cache_dir / f"{key}.json", RESULT_CACHE_TTL)
+        try:
+            return orjson.loads(data) if data is not None else None
+        except orjson.JSONDecodeError:
+            return None
 
-    def extract_audio(self, video_path):
+    def has_cached_results(self, key):
+        """Whether unexpired analysis results are cached for a content hash."""
+        return has_entry(self.cache_dir / f"{key}.json", RESULT_CACHE_TTL)
+
+    def _cache_results(self, key, results):
+        """Stores analysis results and evicts the least recently used entries."""
+        write_atomic(self.cache_dir / f"{key}.json", orjson.dumps(results))
+        evict_lru(self.cache_dir, "*.json", RESULT_CACHE_MAX_ENTRIES, RESULT_CACHE_TTL)
+
+    def reuse_cached_analysis(self, file_path, output_dir=None, cache_key=None):
+        """
+        Writes and returns the results of an earlier analysis of a file with
+        identical contents, or returns None if there is none.
+        
+        cache_key may pass the file's digest if it is already known.
+        """
+        file_path = Path(file_path)
+        output_dir = Path(output_dir) if output_dir else self.output_dir
+        analysis_results = self._cached_results(cache_key or file_digest(file_path))
+        if analysis_results is not None:
+            output_file = output_dir / f"{file_path.stem}_modulation_analysis.json"
+            output_file.write_bytes(orjson.dumps(analysis_results, option=RESULT_JSON_OPTIONS))
+            print(f"♻️  Reusing earlier analysis of identical file {file_path.name}")
+        return analysis_results
+
+    def _extract_audio_command(self, video_paths, output_dir=None):
+        """
+        Returns one ffmpeg command extracting the audio of all given videos, and
+        the Ogg Opus paths in input order.
+        
+        One process with N inputs and N outputs avoids paying ffmpeg's startup
+        and initialization once per file.
+        """
+        video_paths = [Path(p) for p in video_paths]
+        output_dir = Path(output_dir) if output_dir else self.output_dir
+        audio_paths = [str(output_dir / f"{p.stem}_temp_audio.ogg") for p in video_paths]
+        
+        command = ["ffmpeg", "-hide_banner", "-nostats", "-y"]
+        for video_path in video_paths:
+            command += ["-i", str(video_path)]
+        for i, audio_path in enumerate(audio_paths):
+            command += ["-map", f"{i}:a", "-vn", *AUDIO_UPLOAD_ARGS, audio_path]
+        return command, audio_paths
+
+    @staticmethod
+    def _check_ffmpeg(returncode, stderr, video_paths):
+        """Raises with ffmpeg's error output if the extraction failed."""
+        if returncode != 0:
+            raise RuntimeError(
+                f"FFmpeg failed to extract audio from {', '.join(Path(p).name for p in video_paths)} "
+                f"(exit status {returncode}): {stderr.decode(errors='replace').strip()}"
+            )
+
+    def extract_audio_batch(self, video_paths, output_dir=None):
+        """Extracts the audio of several video files with a single ffmpeg process."""
+        command, audio_paths = self._extract_audio_command(video_paths, output_dir)
+        print(f"📦 Extracting audio from {', '.join(Path(p).name for p in video_paths)}...")
+        proc = subprocess.run(command, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE)
+        self._check_ffmpeg(proc.returncode, proc.stderr, video_paths)
+        return audio_paths
+
+    async def extract_audio_batch_async(self, video_paths, output_dir=None):
+        """
+        Extracts audio like extract_audio_batch(), awaiting ffmpeg as an asyncio
+        subprocess so the event loop stays free meanwhile.
+        """
+        command, audio_paths = self._extract_audio_command(video_paths, output_dir)
+        proc = await asyncio.create_subprocess_exec(
+            *command, stdout=asyncio.subprocess.DEVNULL, stderr=asyncio.subprocess.PIPE
+        )
+        _, stderr = await proc.communicate()
+        self._check_ffmpeg(proc.returncode, stderr, video_paths)
+        return audio_paths
+
+    def extract_audio(self, video_path, output_dir=None):
         """Extracts audio from video file using ffmpeg."""
-        video_path = Path(video_path)
-        audio_path = self.output_dir / f"{video_path.stem}_temp_audio.mp3"
+        return self.extract_audio_batch([video_path], output_dir)[0]
+
+    def analyze(self, file_path, output_dir=None, audio_path=None, cache_key=None):
+        """
+        Runs full analysis on the given file.
         
-        print(f"📦 Extracting audio from {video_path.name}...")
-        try:
-            subprocess.run([
-                "ffmpeg", "-i", str(video_path), "-vn", "-acodec", "libmp3lame", "-y", str(audio_path)
-            ], check=True, capture_output=True)
-            return str(audio_path)
-        except subprocess.CalledProcessError as e:
-            print(f"FFmpeg Error: {e.stderr.decode()}")
-            raise
-
-    def analyze(self, file_path):
-        """Runs full analysis on the given file."""
+        Results are written to output_dir (default: self.output_dir). Passing it
+        per call lets one analyzer serve concurrent analyses for different folders.
+        audio_path may point at audio already extracted by extract_audio_batch_async(),
+        and cache_key at the file's digest if the caller already computed it.
+        """
         file_path = Path(file_path)
+        output_dir = Path(output_dir) if output_dir else self.output_dir
+        output_file = output_dir / f"{file_path.stem}_modulation_analysis.json"
+        
+        # A file with identical contents was analyzed before: skip the upload
+        cache_key = cache_key or file_digest(file_path)
+        analysis_results = self.reuse_cached_analysis(file_path, output_dir, cache_key)
+        if analysis_results is not None:
+            return analysis_results
         
         # Extract audio if video
-        if file_path.suffix.lower() == ".mp4":
-            audio_file = self.extract_audio(file_path)
+        if audio_path:
+            audio_file = str(audio_path)
+        elif file_path.suffix.lower() == ".mp4":
+            audio_file = self.extract_audio(file_path, output_dir)
         else:
             audio_file = str(file_path)
 
@@ -61,24 +187,35 @@ class SpeechModulationAnalyzer:
             speaker_labels=True          # Distinguish speakers
         )
 
-        transcriber = aai.Transcriber()
-        transcript = transcriber.transcribe(audio_file, config)
+        transcript = self.transcribe(audio_file, config)
 
         if transcript.status == aai.TranscriptStatus.error:
             raise Exception(f"Transcription error: {transcript.error}")
 
         # Post-process for "Modulation" features
         analysis_results = self.get_modulation_metrics(transcript)
+        self._cache_results(cache_key, analysis_results)
         
         # Save results
-        output_file = self.output_dir / f"{file_path.stem}_modulation_analysis.json"
-        with open(output_file, "w") as f:
-            json.dump(analysis_results, f, indent=4)
+        output_file.write_bytes(orjson.dumps(analysis_results, option=RESULT_JSON_OPTIONS))
 
         print(f"✅ Analysis complete! Results saved to {output_file}")
         self.print_summary(analysis_results)
         return analysis_results
 
+    def transcribe(self, audio_file, config):
+        """
+        Transcribes with AssemblyAI, retrying network failures (timeouts, dropped
+        connections) with backoff. Errors reported by the API are not retried.
+        """
+        for delay in TRANSCRIBE_RETRY_DELAYS:
+            try:
+                return self.transcriber.transcribe(audio_file, config)
+            except httpx.TransportError as e:
+                print(f"⚠️  Transcription request failed ({e}), retrying in {delay}s...")
+                time.sleep(delay)
+        return self.transcriber.transcribe(audio_file, config)
+
     def get_modulation_metrics(self, transcript):
         """Calculates prosody, speech rate, and pause metrics from transcript data."""
         words = transcript.words
@@ -89,32 +226,39 @@ class SpeechModulationAnalyzer:
         duration_minutes = transcript.audio_duration / 60.0
         wpm = total_words / duration_minutes if duration_minutes > 0 else 0
 
+        # Read every word's fields in one C-level pass, then compute the gaps in
+        # one vectorized step
+        starts, ends, texts = zip(*map(attrgetter("start", "end", "text"), words))
+
         # Detect pauses (gaps > 1 second between words)
-        pauses = []
-        fillers = []
-        filler_list = ["um", "uh", "hmm", "mhm", "uh-huh", "ah", "huh", "m"]
-
-        for i in range(len(words) - 1):
-            gap = (words[i+1].start - words[i].end) / 1000.0 # Convert ms to s
-            if gap > 1.0:
-                pauses.append({
-                    "after_word": words[i].text,
-                    "duration_sec": round(gap, 2),
-                    "timestamp_ms": words[i].end
-                })
-            
-            if words[i].text.lower().strip(",.") in filler_list:
-                fillers.append({
-                    "word": words[i].text,
-                    "timestamp_ms": words[i].start
-                })
+        gaps_ms = np.array(starts[1:], dtype=np.int64) - np.array(ends[:-1], dtype=np.int64)
+        pauses = [
+            {
+                "after_word": texts[i],
+                "duration_sec": round(int(gaps_ms[i]) / 1000.0, 2),  # Convert ms to s
+                "timestamp_ms": ends[i]
+            }
+            for i in np.flatnonzero(gaps_ms > 1000).tolist()
+        ]
+
+        # The final word is not checked, as in the original loop over word gaps,
+        # so filler counts stay comparable with earlier results
+        fillers = [
+            {"word": text, "timestamp_ms": start}
+            for text, start in zip(texts[:-1], starts[:-1])
+            if FILLER_RE.fullmatch(text)
+        ]
 
         # Sentiment Summary
-        sentiments = [s.sentiment for s in transcript.sentiment_analysis]
+        # One counting pass; the SDK reports sentiments as str enums, so count
+        # their plain values to make the string lookups below reliable
+        sentiment_counts = Counter(
+            getattr(s.sentiment, "value", s.sentiment) for s in transcript.sentiment_analysis
+        )
         sentiment_summary = {
-            "positive": sentiments.count("POSITIVE"),
-            "neutral": sentiments.count("NEUTRAL"),
-            "negative": sentiments.count("NEGATIVE")
+            "positive": sentiment_counts["POSITIVE"],
+            "neutral": sentiment_counts["NEUTRAL"],
+            "negative": sentiment_counts["NEGATIVE"]
         }
 
         return {
@@ -143,8 +287,6 @@ class SpeechModulationAnalyzer:
 
 if __name__ == "__main__":
     # Example usage
-    import sys
-    
     analyzer = None
     try:
         analyzer = SpeechModulationAnalyzer()